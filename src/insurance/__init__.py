@@ -5,10 +5,18 @@ health insurance plans. The key insight: geometric mean is dominated by
 the minimum outcome, so tail risk protection matters more than expected value.
 """
 
-from src.insurance.plans import MedicalPlan, DentalPlan, VisionPlan, NetworkType
-from src.insurance.scenarios import Scenario, build_scenarios_for_plan
+from src.insurance.plans import MedicalPlan, DentalPlan, VisionPlan, NetworkType, PlanTable
+from src.insurance.scenarios import (
+    Scenario,
+    ScenarioSet,
+    build_scenario_matrix,
+    build_scenarios_for_plan,
+    plan_total_oop,
+    scenarios_by_name,
+)
 from src.insurance.geometric_mean import (
     compute_expected_log_wealth,
+    compute_expected_log_wealth_batch,
     compute_geometric_mean_wealth,
     compute_scenario_wealth,
 )
@@ -18,11 +26,15 @@ from src.insurance.compare import (
     format_comparison_table,
     format_scenario_breakdown,
 )
+from src.insurance.sweep import compare_plans_sweep
 from src.insurance.geometric_mean import (
     compute_wealth_ratio,
     compute_disposable_income,
     compute_geometric_mean_ratio,
+    compute_geometric_mean_ratio_batch,
+    compute_wealth_stats,
     build_scenario_outcomes,
+    build_scenario_outcomes_batch,
 )
 
 __all__ = [
@@ -31,20 +43,31 @@ __all__ = [
     "DentalPlan", 
     "VisionPlan",
     "NetworkType",
+    "PlanTable",
     # Scenarios
     "Scenario",
+    "ScenarioSet",
     "build_scenarios_for_plan",
+    "build_scenario_matrix",
+    "plan_total_oop",
+    "scenarios_by_name",
     # Geometric mean (Spitznagel)
     "compute_expected_log_wealth",
+    "compute_expected_log_wealth_batch",
     "compute_geometric_mean_wealth",
     "compute_scenario_wealth",
     "compute_wealth_ratio",
     "compute_disposable_income",
     "compute_geometric_mean_ratio",
+    "compute_geometric_mean_ratio_batch",
+    "compute_wealth_stats",
     "build_scenario_outcomes",
+    "build_scenario_outcomes_batch",
     # Comparison
     "compare_plans",
     "PlanComparisonResult",
     "format_comparison_table",
     "format_scenario_breakdown",
+    # Sweeps
+    "compare_plans_sweep",
 ]
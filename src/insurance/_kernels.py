@@ -0,0 +1,190 @@
+"""Numeric kernels for scoring plans across scenarios.
+
+These are the inner loops behind compare_plans and the batch/sweep APIs.
+The per-comparison kernels (scenario_kernel, log_wealth_kernel,
+wealth_matrix) are plain NumPy/Python: with a handful of plans and
+scenarios they run in microseconds, less than Numba's import alone.
+
+The batch kernels (log_wealth_batch, gm_sweep) can use Numba: install the
+``fast`` extra and they run the compiled versions in _numba_kernels.
+Numba is imported on the first batch call, not with this package, so
+only processes that run batches pay its import (about 0.4s); the
+compiled code itself is cached in __pycache__ (cache=True). Without
+Numba they fall back to equivalent NumPy implementations.
+
+Array layout (struct-of-arrays):
+- premiums: shape (plans,) - total annual premium per plan
+- oop: shape (plans, scenarios) - scenario OOP per plan (before add-ons)
+
+Log-wealth kernels take log1p(-loss) with loss = (premium + oop) / disposable
+rather than log(1 - loss): for the small losses of a healthy year this keeps
+full precision instead of rounding the ratio first.
+
+All arrays are float64. Wealth ratios are verified against hand-computed
+values to 1e-10, which float32 (~7 significant digits) cannot meet, and
+with a handful of plans and scenarios there is no bandwidth to save.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import math
+from functools import lru_cache
+from types import ModuleType
+from typing import Optional
+
+import numpy as np
+
+# Checked without importing Numba (see _numba)
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+def scenario_kernel(
+    disposable: float,
+    premiums: np.ndarray,
+    addon_oop: float,
+    oop: np.ndarray,
+    out_wealth: np.ndarray,
+    out_ratio: np.ndarray,
+) -> None:
+    """Fill per-scenario wealth (dollars) and wealth ratios (0-1).
+    
+    wealth[i, j] = disposable - premiums[i] - (oop[i, j] + addon_oop)
+    ratio[i, j] = max(0, wealth[i, j] / disposable), or 0 if disposable <= 0
+    """
+    np.subtract(disposable - premiums[:, None], oop + addon_oop, out=out_wealth)
+    if disposable > 0:
+        np.divide(out_wealth, disposable, out=out_ratio)
+        np.maximum(out_ratio, 0.0, out=out_ratio)
+    else:
+        out_ratio[...] = 0.0
+
+
+def _log_wealth_4(
+    disposable: float, premium: float, o0: float, o1: float, o2: float, o3: float
+) -> float:
+    """log_wealth_kernel unrolled for the standard four scenarios.
+    
+    Plain Python (hence the reciprocal multiply and the local log1p
+    binding); _numba_kernels compiles the same function.
+    """
+    inv_disp = 1.0 / disposable
+    l0 = (premium + o0) * inv_disp
+    l1 = (premium + o1) * inv_disp
+    l2 = (premium + o2) * inv_disp
+    l3 = (premium + o3) * inv_disp
+    if l0 >= 1.0 or l1 >= 1.0 or l2 >= 1.0 or l3 >= 1.0:
+        return -math.inf
+    log1p = math.log1p
+    return 0.25 * (log1p(-l0) + log1p(-l1) + log1p(-l2) + log1p(-l3))
+
+
+def log_wealth_kernel(disposable: float, premium: float, oop: np.ndarray) -> float:
+    """E[log(W/W₀)] for one plan: mean over scenarios of log(ratio).
+    
+    ratio[j] = (disposable - premium - oop[j]) / disposable
+    
+    Returns -inf if any ratio is <= 0. Requires disposable > 0 and at
+    least one scenario (callers handle both edge cases).
+    """
+    # Four scalar logs beat NumPy dispatch overhead for the standard set
+    if len(oop) == 4:
+        o0, o1, o2, o3 = oop.tolist()
+        return _log_wealth_4(disposable, premium, o0, o1, o2, o3)
+    loss = (premium + oop) / disposable
+    if (loss >= 1.0).any():
+        return -math.inf
+    return float(np.log1p(-loss).mean())
+
+
+def wealth_matrix(
+    disposable: float,
+    premiums: np.ndarray,
+    addon_oop: float,
+    oop: np.ndarray,
+    out_wealth: np.ndarray,
+    out_ratio: np.ndarray,
+    out_expected_log: np.ndarray,
+    out_gm: np.ndarray,
+) -> None:
+    """scenario_kernel plus per-plan E[log(W/W₀)] and GM, in one call.
+    
+    out_expected_log[i] = log_wealth_kernel of row i with addon_oop added,
+    or -inf if any ratio is 0 (or disposable <= 0)
+    out_gm[i] = exp(out_expected_log[i]) × disposable (0 when ruined)
+    """
+    scenario_kernel(disposable, premiums, addon_oop, oop, out_wealth, out_ratio)
+    if disposable <= 0:
+        out_expected_log[:] = -np.inf
+        out_gm[:] = 0.0
+        return
+    # One log_wealth_kernel call per plan (the scalar path's kernel, so the
+    # two agree bit for bit); compare_plans builds a result per plan anyway
+    premium_list = premiums.tolist()
+    for i, row in enumerate(oop + addon_oop):
+        expected_log = log_wealth_kernel(disposable, premium_list[i], row)
+        out_expected_log[i] = expected_log
+        # exp(-inf) = 0, so a ruined plan gets GM = 0
+        out_gm[i] = math.exp(expected_log) * disposable
+
+
+def _log_wealth_batch_numpy(
+    disposable: float, premiums: np.ndarray, oop: np.ndarray, out: np.ndarray
+) -> None:
+    """NumPy fallback for log_wealth_batch (same contract)."""
+    loss = (premiums[:, None] + oop) / disposable
+    ruined = (loss >= 1.0).any(axis=1)
+    log_ratios = np.log1p(-np.where(ruined[:, None], 0.0, loss))
+    out[:] = np.where(ruined, -np.inf, log_ratios.mean(axis=1))
+
+
+def _gm_sweep_numpy(
+    disposables: np.ndarray, premiums: np.ndarray, oop: np.ndarray, out: np.ndarray
+) -> None:
+    """NumPy fallback for gm_sweep (same contract)."""
+    solvent = disposables > 0
+    scale = np.where(solvent, disposables, 1.0)[:, None, None]
+    loss = (premiums[None, :, None] + oop[None, :, :]) / scale
+    ruined = (loss >= 1.0).any(axis=2) | ~solvent[:, None]
+    log_ratios = np.log1p(-np.where(ruined[:, :, None], 0.0, loss))
+    out[:] = np.where(ruined, 0.0, np.exp(log_ratios.mean(axis=2)) * disposables[:, None])
+
+
+@lru_cache(maxsize=None)
+def _numba() -> Optional[ModuleType]:
+    """The compiled batch kernels, imported on first use (None without Numba)."""
+    if not HAS_NUMBA:
+        return None
+    try:
+        from src.insurance import _numba_kernels
+    except ImportError:  # pragma: no cover - broken Numba install
+        return None
+    return _numba_kernels
+
+
+def log_wealth_batch(
+    disposable: float, premiums: np.ndarray, oop: np.ndarray, out: np.ndarray
+) -> None:
+    """log_wealth_kernel for every plan row.
+    
+    out[i] = mean_j log((disposable - premiums[i] - oop[i, j]) / disposable),
+    or -inf if any ratio in row i is <= 0. Same preconditions as
+    log_wealth_kernel. Parallel over plans when Numba is installed.
+    """
+    compiled = _numba()
+    kernel = compiled.log_wealth_batch if compiled else _log_wealth_batch_numpy
+    kernel(disposable, premiums, oop, out)
+
+
+def gm_sweep(
+    disposables: np.ndarray, premiums: np.ndarray, oop: np.ndarray, out: np.ndarray
+) -> None:
+    """GM wealth for every (disposable income, plan) pair.
+    
+    out[k, i] = exp(mean_j log1p(-(premiums[i] + oop[i, j]) / disposables[k]))
+    × disposables[k], or 0 if that plan is ruined (or disposables[k] <= 0).
+    Parallel over incomes when Numba is installed.
+    """
+    compiled = _numba()
+    kernel = compiled.gm_sweep if compiled else _gm_sweep_numpy
+    kernel(disposables, premiums, oop, out)
@@ -0,0 +1,62 @@
+"""Numba-compiled batch kernels.
+
+Imported by _kernels on the first batch call (never at package import),
+so only processes that run batches pay Numba's import. Same contracts as
+the log_wealth_batch / gm_sweep wrappers in _kernels.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from src.insurance import _kernels
+
+# fastmath without nnan/ninf: the kernels return -inf for ruin
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+_log_wealth_4 = njit(cache=True, inline="always", fastmath=_FASTMATH)(_kernels._log_wealth_4)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def log_wealth_kernel(disposable, premium, oop):
+    """Compiled _kernels.log_wealth_kernel (same contract)."""
+    n = oop.shape[0]
+    if n == 4:
+        return _log_wealth_4(disposable, premium, oop[0], oop[1], oop[2], oop[3])
+    log_sum = 0.0
+    # Standard scenarios run from no_use up to the catastrophes: scan
+    # backwards so a ruined plan exits on the first (largest) OOP
+    for j in range(n - 1, -1, -1):
+        loss = (premium + oop[j]) / disposable
+        if loss >= 1.0:
+            return -np.inf
+        log_sum += np.log1p(-loss)
+    return log_sum / n
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH)
+def log_wealth_batch(disposable, premiums, oop, out):
+    """log_wealth_kernel for every plan, one thread per block of rows."""
+    n_plans, n_scenarios = oop.shape
+    for i in prange(n_plans):
+        log_sum = 0.0
+        for j in range(n_scenarios - 1, -1, -1):  # catastrophes first
+            loss = (premiums[i] + oop[i, j]) / disposable
+            if loss >= 1.0:
+                log_sum = -np.inf
+                break
+            log_sum += np.log1p(-loss)
+        out[i] = log_sum / n_scenarios
+
+
+@njit(cache=True, parallel=True)
+def gm_sweep(disposables, premiums, oop, out):
+    """GM wealth for every (disposable income, plan) pair, threads over incomes."""
+    n_plans = oop.shape[0]
+    for k in prange(disposables.shape[0]):
+        disposable = disposables[k]
+        for i in range(n_plans):
+            if disposable <= 0.0:
+                out[k, i] = 0.0
+                continue
+            # exp(-inf) = 0, so a ruined plan gets GM = 0
+            out[k, i] = np.exp(log_wealth_kernel(disposable, premiums[i], oop[i])) * disposable
@@ -0,0 +1,63 @@
+"""Plan-side arrays shared by compare_plans and compare_plans_sweep.
+
+Both score the same plans for many incomes, so the plan table and the
+(plans, scenarios) OOP matrix are built once per plan set and cached.
+Cache keys hold plans and scenarios in hashable (tuple) form.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.insurance.plans import MedicalPlan, PlanTable
+from src.insurance.scenarios import Scenario, build_scenarios_for_plan, plan_total_oop
+
+
+class PlanArrays(NamedTuple):
+    """Plan-side arrays for a plan set (independent of income and add-ons)."""
+    
+    table: PlanTable
+    oop: np.ndarray  # (plans, scenarios) scenario OOP before add-ons
+    scenario_names: Tuple[Tuple[str, ...], ...]  # per plan, in scenario order
+
+
+@lru_cache(maxsize=64)
+def plan_arrays(
+    plans: Union[Tuple[MedicalPlan, ...], PlanTable],
+    scenarios: Optional[Tuple[Scenario, ...]],
+) -> PlanArrays:
+    """Build the plan table and OOP matrix once per plan set.
+    
+    Income sweeps and repeated comparisons reuse the same plans, so the
+    Python-to-NumPy marshalling is paid once rather than on every call.
+    """
+    table = plans if isinstance(plans, PlanTable) else PlanTable.from_plans(plans)
+    names: Tuple[Tuple[str, ...], ...]
+    if len(table) == 0:
+        oop = np.empty((0, 0))
+        names = ()
+    elif scenarios:
+        oop = np.tile(Scenario.pack_total_oop(scenarios), (len(table), 1))
+        names = (tuple(s.name for s in scenarios),) * len(table)
+    else:
+        oop = np.vstack([plan_total_oop(p) for p in table.plans])
+        names = tuple(
+            tuple(s.name for s in build_scenarios_for_plan(p)) for p in table.plans
+        )
+    oop.flags.writeable = False
+    return PlanArrays(table, oop, names)
+
+
+def plans_key(
+    plans: Union[Sequence[MedicalPlan], PlanTable],
+) -> Union[Tuple[MedicalPlan, ...], PlanTable]:
+    """plans in hashable form, for the plan caches."""
+    return plans if isinstance(plans, PlanTable) else tuple(plans)
+
+
+def scenarios_key(scenarios: Optional[Sequence[Scenario]]) -> Optional[Tuple[Scenario, ...]]:
+    """scenarios in hashable form, for the plan caches."""
+    return None if scenarios is None else tuple(scenarios)
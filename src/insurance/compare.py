@@ -1,29 +1,47 @@
 """Plan comparison utilities.
 
 Compare multiple insurance plans and rank by geometric mean.
+
+All plans are scored together: premiums and per-scenario OOP are laid out
+as NumPy arrays (one row per plan, one column per scenario) so wealth,
+ratios, and geometric means come from a single broadcast.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
-
-from src.insurance.plans import MedicalPlan, DentalPlan, VisionPlan, total_annual_premium
-from src.insurance.scenarios import Scenario, build_scenarios_for_plan
-from src.insurance.geometric_mean import (
-    compute_expected_log_wealth,
-    compute_geometric_mean_wealth,
-    compute_wealth_ratio,
-    compute_disposable_income,
-    build_scenario_outcomes,
+from dataclasses import dataclass
+from functools import lru_cache
+from numbers import Real
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from src.insurance._kernels import wealth_matrix
+from src.insurance._plan_arrays import plan_arrays, plans_key, scenarios_key
+from src.insurance.geometric_mean import disposable_from_after_tax, disposable_from_gross
+from src.insurance.plans import (
+    MedicalPlan,
+    DentalPlan,
+    VisionPlan,
+    PlanTable,
+    total_annual_premiums_vec,
 )
+from src.insurance.scenarios import Scenario
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, init=False, eq=False)
 class PlanComparisonResult:
     """Result of comparing a single plan.
     
-    Contains all relevant metrics for ranking and display.
+    Contains all relevant metrics for ranking and display. Per-scenario
+    values are stored as parallel arrays aligned with scenario_names;
+    scenario_wealth / scenario_ratios give dict views keyed by name.
+    Frozen, since compare_plans shares cached results between callers.
+    
+    The constructor still accepts the scenario_wealth / scenario_ratios
+    dicts (scenario order follows scenario_wealth; a scenario missing from
+    scenario_ratios gets ratio 0), or the names and arrays directly.
+    Results compare equal when every field, array contents included, matches.
     
     Attributes:
         plan_name: Name of the medical plan
@@ -32,8 +50,9 @@ class PlanComparisonResult:
         in_network_oop_max: Maximum in-network out-of-pocket
         expected_log_wealth: E[log(W/W₀)] - the optimization target
         geometric_mean: GM wealth in dollars
-        scenario_wealth: Per-scenario wealth breakdown (in dollars)
-        scenario_ratios: Per-scenario wealth ratios (0-1 scale)
+        scenario_names: Scenario names, in scenario order
+        scenario_wealth_arr: Per-scenario wealth (in dollars)
+        scenario_ratios_arr: Per-scenario wealth ratios (0-1 scale)
     """
     
     plan_name: str
@@ -42,12 +61,87 @@ class PlanComparisonResult:
     in_network_oop_max: float
     expected_log_wealth: float
     geometric_mean: float
-    scenario_wealth: Dict[str, float] = field(default_factory=dict)
-    scenario_ratios: Dict[str, float] = field(default_factory=dict)
+    scenario_names: Tuple[str, ...]
+    scenario_wealth_arr: np.ndarray
+    scenario_ratios_arr: np.ndarray
+    
+    def __init__(
+        self,
+        plan_name: str,
+        annual_premium: float,
+        total_annual_premium: float,
+        in_network_oop_max: float,
+        expected_log_wealth: float,
+        geometric_mean: float,
+        scenario_wealth: Optional[Mapping[str, float]] = None,
+        scenario_ratios: Optional[Mapping[str, float]] = None,
+        *,
+        scenario_names: Tuple[str, ...] = (),
+        scenario_wealth_arr: Optional[np.ndarray] = None,
+        scenario_ratios_arr: Optional[np.ndarray] = None,
+    ) -> None:
+        if scenario_wealth is not None or scenario_ratios is not None:
+            if scenario_names or scenario_wealth_arr is not None or scenario_ratios_arr is not None:
+                raise TypeError(
+                    "Pass scenario_wealth/scenario_ratios dicts or scenario "
+                    "names and arrays, not both"
+                )
+            wealth_by_name = dict(scenario_wealth or {})
+            ratio_by_name = dict(scenario_ratios or {})
+            scenario_names = tuple(wealth_by_name)
+            scenario_wealth_arr = np.array(list(wealth_by_name.values()), dtype=np.float64)
+            scenario_ratios_arr = np.array(
+                [ratio_by_name.get(name, 0.0) for name in scenario_names], dtype=np.float64
+            )
+        
+        values = (
+            ("plan_name", plan_name),
+            ("annual_premium", annual_premium),
+            ("total_annual_premium", total_annual_premium),
+            ("in_network_oop_max", in_network_oop_max),
+            ("expected_log_wealth", expected_log_wealth),
+            ("geometric_mean", geometric_mean),
+            ("scenario_names", tuple(scenario_names)),
+            ("scenario_wealth_arr",
+             np.empty(0) if scenario_wealth_arr is None else scenario_wealth_arr),
+            ("scenario_ratios_arr",
+             np.empty(0) if scenario_ratios_arr is None else scenario_ratios_arr),
+        )
+        # Frozen: assign through object.__setattr__, as dataclass's __init__ does
+        for name, value in values:
+            object.__setattr__(self, name, value)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlanComparisonResult):
+            return NotImplemented
+        return (
+            self.plan_name == other.plan_name
+            and self.annual_premium == other.annual_premium
+            and self.total_annual_premium == other.total_annual_premium
+            and self.in_network_oop_max == other.in_network_oop_max
+            and self.expected_log_wealth == other.expected_log_wealth
+            and self.geometric_mean == other.geometric_mean
+            and self.scenario_names == other.scenario_names
+            and np.array_equal(self.scenario_wealth_arr, other.scenario_wealth_arr)
+            and np.array_equal(self.scenario_ratios_arr, other.scenario_ratios_arr)
+        )
+    
+    # Holds arrays, so unhashable (like the original mutable dataclass)
+    __hash__ = None  # type: ignore[assignment]
+    
+    @property
+    def scenario_wealth(self) -> Dict[str, float]:
+        """Per-scenario wealth breakdown (in dollars), keyed by scenario name."""
+        return dict(zip(self.scenario_names, self.scenario_wealth_arr.tolist()))
+    
+    @property
+    def scenario_ratios(self) -> Dict[str, float]:
+        """Per-scenario wealth ratios (0-1 scale), keyed by scenario name."""
+        return dict(zip(self.scenario_names, self.scenario_ratios_arr.tolist()))
 
 
 def compare_plans(
-    plans: List[MedicalPlan],
+    plans: Union[List[MedicalPlan], PlanTable],
     annual_income: float,
     annual_baseline_spend: float,
     dental: Optional[DentalPlan] = None,
@@ -58,7 +152,7 @@ def compare_plans(
     """Compare multiple plans and rank by geometric mean.
     
     Args:
-        plans: List of medical plans to compare
+        plans: Medical plans to compare, as a list or a prebuilt PlanTable
         annual_income: Gross annual income (or after-tax if tax_rate=None)
         annual_baseline_spend: Fixed non-health spending
         dental: Optional dental add-on (applied to all plans)
@@ -78,87 +172,89 @@ def compare_plans(
         >>> for r in results:
         ...     print(f"{r.plan_name}: GM=${r.geometric_mean:,.0f}")
     """
-    results = []
-    
-    # Compute disposable income once
+    # Plans, add-ons and scenarios are frozen: memoize on them, with lists
+    # turned into tuples for the key. Each caller gets its own result list.
+    args = (
+        plans_key(plans), annual_income, annual_baseline_spend, dental, vision,
+        scenarios_key(scenarios), tax_rate,
+    )
+    # Only plain numbers key the cache (0-d arrays are unhashable and mutable)
+    numbers = (annual_income, annual_baseline_spend, tax_rate)
+    if all(isinstance(x, Real) for x in numbers if x is not None):
+        return list(_compare_plans_cached(*args))
+    return list(_compare_plans(*args))
+
+
+def _compare_plans(
+    plans: Union[Tuple[MedicalPlan, ...], PlanTable],
+    annual_income: float,
+    annual_baseline_spend: float,
+    dental: Optional[DentalPlan],
+    vision: Optional[VisionPlan],
+    scenarios: Optional[Tuple[Scenario, ...]],
+    tax_rate: Optional[float],
+) -> Tuple[PlanComparisonResult, ...]:
+    """compare_plans body (uncached; see _compare_plans_cached)."""
+    # Compute disposable income once, picking the specialized form up front
     if tax_rate is not None:
-        disposable = compute_disposable_income(
-            gross_income=annual_income,
-            tax_rate=tax_rate,
-            baseline_spend=annual_baseline_spend,
+        disposable = disposable_from_gross(
+            float(annual_income), float(tax_rate), float(annual_baseline_spend)
         )
-        after_tax = annual_income * (1 - tax_rate)
     else:
         # Assume annual_income is already after-tax
-        disposable = annual_income - annual_baseline_spend
-        after_tax = annual_income
-    
-    for plan in plans:
-        # Build scenarios for this plan (or use custom)
-        plan_scenarios = scenarios if scenarios else build_scenarios_for_plan(plan)
-        
-        # Compute metrics using new API
-        expected_log = compute_expected_log_wealth(
-            plan=plan,
-            scenarios=plan_scenarios,
-            baseline_spend=annual_baseline_spend,
-            after_tax_income=after_tax,
-            dental=dental,
-            vision=vision,
+        disposable = disposable_from_after_tax(
+            float(annual_income), float(annual_baseline_spend)
         )
-        
-        gm = compute_geometric_mean_wealth(
-            plan=plan,
-            scenarios=plan_scenarios,
-            baseline_spend=annual_baseline_spend,
-            after_tax_income=after_tax,
-            dental=dental,
-            vision=vision,
-        )
-        
-        # Compute total premium
-        total_premium = total_annual_premium(plan, dental, vision)
-        
-        # Compute add-on OOP
-        addon_oop = 0.0
-        if dental:
-            addon_oop += dental.expected_oop
-        if vision:
-            addon_oop += vision.expected_oop
-        
-        # Per-scenario wealth breakdown (dollars AND ratios)
-        scenario_wealth = {}
-        scenario_ratios = {}
-        for s in plan_scenarios:
-            total_oop = s.total_oop + addon_oop
-            
-            # Dollar wealth
-            wealth = disposable - total_premium - total_oop
-            scenario_wealth[s.name] = wealth
-            
-            # Ratio (0-1)
-            ratio = compute_wealth_ratio(
-                disposable_income=disposable,
-                total_premium=total_premium,
-                scenario_oop=total_oop,
-            )
-            scenario_ratios[s.name] = ratio
-        
-        results.append(PlanComparisonResult(
-            plan_name=plan.name,
-            annual_premium=plan.annual_premium,
-            total_annual_premium=total_premium,
-            in_network_oop_max=plan.in_network_oop_max,
-            expected_log_wealth=expected_log,
-            geometric_mean=gm,
-            scenario_wealth=scenario_wealth,
-            scenario_ratios=scenario_ratios,
-        ))
     
-    # Sort by geometric mean (best first)
-    results.sort(key=lambda r: r.geometric_mean, reverse=True)
+    table, oop, scenario_names = plan_arrays(plans, scenarios)
+    if len(table) == 0:
+        return ()
     
-    return results
+    # Compute add-on OOP (same for every plan)
+    addon_oop = 0.0
+    if dental:
+        addon_oop += dental.expected_oop
+    if vision:
+        addon_oop += vision.expected_oop
+    
+    # Struct-of-arrays layout: one row per plan, one column per scenario
+    # Add-on premiums are plan-independent: one broadcast add each
+    premiums = total_annual_premiums_vec(table, dental, vision)
+    
+    # Per-scenario wealth breakdown (dollars AND ratios) plus E[log(W/W₀)]
+    # with equal weighting and GM, for all plans in one kernel call
+    # (any zero ratio → -∞ and GM = 0)
+    wealth = np.empty_like(oop)
+    ratios = np.empty_like(oop)
+    expected_log = np.empty(len(table))
+    gm = np.empty(len(table))
+    wealth_matrix(disposable, premiums, addon_oop, oop, wealth, ratios, expected_log, gm)
+    # Results hold row views and may be shared through the cache
+    wealth.flags.writeable = False
+    ratios.flags.writeable = False
+    
+    # Rank by geometric mean (best first, ties keep input order) and build
+    # results directly in that order - no key-function sort afterwards
+    order = np.argsort(-gm, kind="stable")
+    
+    return tuple(
+        PlanComparisonResult(
+            plan_name=table.names[i],
+            annual_premium=float(table.annual_premium[i]),
+            total_annual_premium=float(premiums[i]),
+            in_network_oop_max=float(table.in_network_oop_max[i]),
+            expected_log_wealth=float(expected_log[i]),
+            geometric_mean=float(gm[i]),
+            scenario_names=scenario_names[i],
+            scenario_wealth_arr=wealth[i],
+            scenario_ratios_arr=ratios[i],
+        )
+        for i in order.tolist()
+    )
+
+
+# compare_plans body, cached on its (hashable) arguments
+_compare_plans_cached = lru_cache(maxsize=128)(_compare_plans)
 
 
 def format_comparison_table(results: List[PlanComparisonResult]) -> str:
@@ -179,13 +275,12 @@ def format_comparison_table(results: List[PlanComparisonResult]) -> str:
         "|------|------|---------|---------|-----------|-----------|",
     ]
     
-    for i, r in enumerate(results, 1):
-        premium = f"${r.total_annual_premium:,.0f}"
-        oop_max = f"${r.in_network_oop_max:,.0f}"
-        gm = f"${r.geometric_mean:,.0f}"
-        log_w = f"{r.expected_log_wealth:.4f}"
-        
-        lines.append(f"| {i} | {r.plan_name} | {premium} | {oop_max} | {gm} | {log_w} |")
+    # One f-string per row (no per-cell intermediate strings)
+    lines.extend(
+        f"| {i} | {r.plan_name} | ${r.total_annual_premium:,.0f} | ${r.in_network_oop_max:,.0f}"
+        f" | ${r.geometric_mean:,.0f} | {r.expected_log_wealth:.4f} |"
+        for i, r in enumerate(results, 1)
+    )
     
     return "\n".join(lines)
 
@@ -206,9 +301,11 @@ def format_scenario_breakdown(result: PlanComparisonResult) -> str:
         "|----------|--------|-------|",
     ]
     
-    for name in result.scenario_wealth:
-        wealth = result.scenario_wealth[name]
-        ratio = result.scenario_ratios.get(name, 0)
-        lines.append(f"| {name} | ${wealth:,.0f} | {ratio:.1%} |")
+    lines.extend(
+        f"| {name} | ${wealth:,.0f} | {ratio:.1%} |"
+        for name, wealth, ratio in zip(
+            result.scenario_names, result.scenario_wealth_arr, result.scenario_ratios_arr
+        )
+    )
     
     return "\n".join(lines)
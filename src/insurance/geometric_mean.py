@@ -21,10 +21,26 @@ The health insurance "put" is the OOP maximum - it caps your downside.
 from __future__ import annotations
 
 import math
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple, TypeVar, Union
 
-from src.insurance.plans import MedicalPlan, DentalPlan, VisionPlan, total_annual_premium
-from src.insurance.scenarios import Scenario, build_scenarios_for_plan
+import numpy as np
+
+from src.insurance._kernels import log_wealth_batch, log_wealth_kernel
+from src.insurance.plans import (
+    MedicalPlan,
+    DentalPlan,
+    VisionPlan,
+    PlanTable,
+    total_annual_premium,
+    total_annual_premiums_vec,
+)
+from src.insurance.scenarios import (
+    Scenario,
+    ScenarioSet,
+    build_scenario_matrix,
+    build_scenarios_for_plan,
+    plan_total_oop,
+)
 
 
 # =============================================================================
@@ -61,11 +77,26 @@ def compute_wealth_ratio(
     if disposable_income <= 0:
         return 0.0
     
-    remaining = disposable_income - total_premium - scenario_oop
-    ratio = remaining / disposable_income
-    
-    # Floor at 0 (can't have negative wealth ratio)
-    return max(0.0, ratio)
+    # Floor at 0 (can't have negative wealth ratio); a conditional
+    # expression rather than max() avoids a builtin call per ratio
+    ratio = (disposable_income - total_premium - scenario_oop) / disposable_income
+    return ratio if ratio > 0.0 else 0.0
+
+
+# Income as one float, or an array of incomes (sweeps)
+IncomeT = TypeVar("IncomeT", float, np.ndarray)
+
+
+def disposable_from_after_tax(after_tax_income: IncomeT, baseline_spend: float) -> IncomeT:
+    """Disposable income when after-tax income is known."""
+    return after_tax_income - baseline_spend
+
+
+def disposable_from_gross(
+    gross_income: IncomeT, tax_rate: float, baseline_spend: float
+) -> IncomeT:
+    """Disposable income from gross income and an effective tax rate."""
+    return gross_income * (1 - tax_rate) - baseline_spend
 
 
 def compute_disposable_income(
@@ -107,19 +138,21 @@ def compute_disposable_income(
     """
     # Prefer after_tax_income if provided
     if after_tax_income is not None:
-        return after_tax_income - baseline_spend
+        return disposable_from_after_tax(after_tax_income, baseline_spend)
     
     # Fall back to gross with tax rate
     if gross_income is not None:
         rate = tax_rate if tax_rate is not None else 0.0
-        after_tax = gross_income * (1 - rate)
-        return after_tax - baseline_spend
+        return disposable_from_gross(gross_income, rate, baseline_spend)
     
     # No income provided
     return -baseline_spend
 
 
-def compute_geometric_mean_ratio(ratios: List[float]) -> float:
+def compute_geometric_mean_ratio(
+    ratios: Union[Sequence[float], np.ndarray],
+    exact: bool = False,
+) -> float:
     """Compute geometric mean of wealth ratios.
     
     GM = (r1 × r2 × ... × rn) ^ (1/n)
@@ -127,8 +160,16 @@ def compute_geometric_mean_ratio(ratios: List[float]) -> float:
     Key property: ANY zero ratio makes GM = 0 (Spitznagel's insight).
     This is why tail risk protection matters more than expected value.
     
+    Computed in log space as exp(mean(log(r))). Four ratios (the standard
+    scenarios) take an unrolled scalar path; otherwise NumPy arrays (e.g.
+    from build_scenario_outcomes) are reduced in a single vectorized pass
+    and plain lists use a scalar loop. All accumulate in plain float64;
+    pass exact=True for a correctly rounded log sum (math.fsum) on very
+    long inputs such as Monte Carlo draws.
+    
     Args:
-        ratios: List of wealth ratios (each 0.0 to 1.0)
+        ratios: Wealth ratios (each 0.0 to 1.0), as a list or NumPy array
+        exact: Use compensated (math.fsum) summation of the logs
         
     Returns:
         Geometric mean of ratios
@@ -137,62 +178,312 @@ def compute_geometric_mean_ratio(ratios: List[float]) -> float:
         >>> gm = compute_geometric_mean_ratio([0.9, 0.8, 0.7, 0.6])
         >>> print(f"GM = {gm:.3f}")  # 0.741
     """
-    if not ratios:
+    n = len(ratios)
+    if n == 0:
         return 0.0
     
-    n = len(ratios)
-    product = 1.0
+    # Scalar fast path - not worth a NumPy dispatch
+    if n == 1:
+        r = float(ratios[0])
+        return r if r > 0 else 0.0
+    
+    # The standard four scenarios: unrolled, no loop or NumPy dispatch
+    if n == 4 and not exact:
+        r0, r1, r2, r3 = ratios.tolist() if isinstance(ratios, np.ndarray) else ratios
+        if r0 <= 0 or r1 <= 0 or r2 <= 0 or r3 <= 0:
+            return 0.0  # Any zero → GM = 0
+        log = math.log
+        return math.exp((log(r0) + log(r1) + log(r2) + log(r3)) * 0.25)
+    
+    if isinstance(ratios, np.ndarray):
+        # One min-reduction, no temporary boolean array
+        if ratios.min() <= 0:
+            return 0.0  # Any zero → GM = 0
+        logs = np.log(ratios)
+        if exact:
+            return math.exp(math.fsum(logs.tolist()) / n)
+        return float(np.exp(logs.mean()))
+    
+    if exact:
+        if any(r <= 0 for r in ratios):
+            return 0.0
+        return math.exp(math.fsum(map(math.log, ratios)) / n)
+    
+    # Sum of logs rather than product-then-root: no underflow on long lists
+    log = math.log  # local binding: one lookup, not one per element
+    log_sum = 0.0
     
     for r in ratios:
         if r <= 0:
             return 0.0  # Any zero → GM = 0
-        product *= r
+        log_sum += log(r)
+    
+    return math.exp(log_sum / n)
+
+
+def compute_geometric_mean_ratio_batch(ratios: np.ndarray) -> np.ndarray:
+    """Row-wise compute_geometric_mean_ratio for a 2-D array of ratios.
+    
+    Scores many ratio vectors (e.g. one row per plan) in one vectorized
+    log/mean/exp pass. Same zero rule: a row with any ratio <= 0 has
+    GM = 0.
+    
+    Args:
+        ratios: Wealth ratios of shape (rows, scenarios)
+        
+    Returns:
+        Array of shape (rows,) with the geometric mean of each row
+        
+    Example:
+        >>> compute_geometric_mean_ratio_batch(np.array([[0.9, 0.8], [0.9, 0.0]]))
+        array([0.84852814, 0.        ])
+    """
+    ratios = np.asarray(ratios, dtype=np.float64)
+    if ratios.shape[1] == 0:
+        return np.zeros(ratios.shape[0])
+    
+    ruined = np.any(ratios <= 0, axis=1)
+    log_ratios = np.log(np.where(ruined[:, None], 1.0, ratios))
+    return np.where(ruined, 0.0, np.exp(log_ratios.mean(axis=1)))
+
+
+def _scenario_oops(
+    plan: MedicalPlan,
+    scenarios: Optional[Union[Sequence[Scenario], ScenarioSet]],
+    dental: Optional[DentalPlan],
+    vision: Optional[VisionPlan],
+) -> np.ndarray:
+    """Per-scenario OOP including expected dental/vision OOP."""
+    addon_oop = 0.0
+    if dental is not None:
+        addon_oop += dental.expected_oop
+    if vision is not None:
+        addon_oop += vision.expected_oop
     
-    return product ** (1.0 / n)
+    # The plan's standard scenarios have a cached packed OOP vector
+    if scenarios is None:
+        return plan_total_oop(plan) + addon_oop
+    if isinstance(scenarios, ScenarioSet):
+        return scenarios.total_oop + addon_oop
+    return Scenario.pack_total_oop(scenarios) + addon_oop
+
+
+def _scenario_oop_matrix(
+    table: PlanTable,
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
+    dental: Optional[DentalPlan],
+    vision: Optional[VisionPlan],
+) -> np.ndarray:
+    """(plans, scenarios) matrix of _scenario_oops, one row per table plan."""
+    if scenarios is None:
+        # Each plan's standard scenarios, built for all plans at once
+        addon_oop = 0.0
+        if dental is not None:
+            addon_oop += dental.expected_oop
+        if vision is not None:
+            addon_oop += vision.expected_oop
+        medical_oop, extra_oon = build_scenario_matrix(table.plans)
+        oop: np.ndarray = medical_oop + extra_oon + addon_oop
+        return oop
+    if len(table) == 0:
+        return np.empty((0, len(scenarios)))
+    # Shared scenarios: the same OOP row for every plan
+    row = _scenario_oops(table.plans[0], scenarios, dental, vision)
+    return np.tile(row, (len(table), 1))
 
 
 def build_scenario_outcomes(
     disposable_income: float,
     plan: MedicalPlan,
-    scenarios: List[Scenario],
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
     dental: Optional[DentalPlan] = None,
     vision: Optional[VisionPlan] = None,
-) -> List[float]:
-    """Build list of wealth ratios for each scenario.
+) -> np.ndarray:
+    """Build array of wealth ratios for each scenario.
     
     Each outcome is the fraction of disposable income retained.
+    Same formula as compute_wealth_ratio, applied to all scenarios at once.
     
     Args:
         disposable_income: After-tax income minus baseline
         plan: Medical plan being evaluated
-        scenarios: List of possible outcomes
+        scenarios: List or ScenarioSet of outcomes (None = the plan's standard scenarios)
         dental: Optional dental add-on
         vision: Optional vision add-on
         
     Returns:
-        List of wealth ratios (one per scenario)
+        NumPy array of wealth ratios (one per scenario)
     """
-    # Compute total premium
     premium = total_annual_premium(plan, dental, vision)
+    oops = _scenario_oops(plan, scenarios, dental, vision)
     
-    # Add expected dental/vision OOP
-    addon_oop = 0.0
-    if dental is not None:
-        addon_oop += dental.expected_oop
-    if vision is not None:
-        addon_oop += vision.expected_oop
+    if disposable_income <= 0:
+        return np.zeros_like(oops)
+    
+    # Floor at 0 (can't have negative wealth ratio)
+    return np.maximum(0.0, (disposable_income - premium - oops) / disposable_income)
+
+
+def build_scenario_outcomes_batch(
+    disposable_income: float,
+    plans: Union[Sequence[MedicalPlan], PlanTable],
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
+    dental: Optional[DentalPlan] = None,
+    vision: Optional[VisionPlan] = None,
+) -> np.ndarray:
+    """Build wealth ratios for many plans as a (plans, scenarios) matrix.
+    
+    Batched build_scenario_outcomes: row i holds plan i's ratios, computed
+    for all plans in one broadcast. Pairs with
+    compute_geometric_mean_ratio_batch to score every plan at once.
+    
+    Args:
+        disposable_income: After-tax income minus baseline
+        plans: Medical plans to evaluate, as a list or a prebuilt PlanTable
+        scenarios: Shared list or ScenarioSet for every plan (None = each plan's own)
+        dental: Optional dental add-on
+        vision: Optional vision add-on
+        
+    Returns:
+        Array of shape (len(plans), scenarios) of wealth ratios
+        
+    Example:
+        >>> ratios = build_scenario_outcomes_batch(100_000, ALL_PLANS, None)
+        >>> gms = compute_geometric_mean_ratio_batch(ratios)
+    """
+    table = plans if isinstance(plans, PlanTable) else PlanTable.from_plans(plans)
+    oop = _scenario_oop_matrix(table, scenarios, dental, vision)
+    
+    if disposable_income <= 0:
+        return np.zeros_like(oop)
+    
+    premiums = total_annual_premiums_vec(table, dental, vision)
+    # Floor at 0 (can't have negative wealth ratio)
+    ratios: np.ndarray = np.maximum(
+        0.0, (disposable_income - premiums[:, None] - oop) / disposable_income
+    )
+    return ratios
+
+
+def compute_wealth_stats(
+    plan: MedicalPlan,
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
+    baseline_spend: float,
+    after_tax_income: Optional[float] = None,
+    gross_income: Optional[float] = None,
+    tax_rate: Optional[float] = None,
+    dental: Optional[DentalPlan] = None,
+    vision: Optional[VisionPlan] = None,
+) -> Tuple[float, float]:
+    """Compute expected log-wealth and geometric mean wealth in one pass.
+    
+    Since GM = exp(E[log(W/W₀)]) × W₀, both metrics come from the same
+    per-scenario ratios. Disposable income and the ratios are computed
+    once and shared.
+    
+    Args:
+        plan: Medical plan to evaluate
+        scenarios: List or ScenarioSet of outcomes (None = the plan's standard scenarios)
+        baseline_spend: Fixed non-health spending
+        after_tax_income: Income after taxes (preferred)
+        gross_income: Gross income before taxes
+        tax_rate: Effective tax rate (0.0 to 1.0)
+        dental: Optional dental add-on
+        vision: Optional vision add-on
+        
+    Returns:
+        Tuple of (E[log(W/W₀)], GM wealth in dollars)
+        
+    Example:
+        >>> expected_log, gm = compute_wealth_stats(
+        ...     plan=gold_ppo,
+        ...     scenarios=scenarios,
+        ...     baseline_spend=80_000,
+        ...     after_tax_income=180_000,
+        ... )
+    """
+    disposable = compute_disposable_income(
+        baseline_spend=baseline_spend,
+        after_tax_income=after_tax_income,
+        gross_income=gross_income,
+        tax_rate=tax_rate,
+    )
+    
+    if disposable <= 0:
+        return float("-inf"), 0.0
+    
+    oops = _scenario_oops(plan, scenarios, dental, vision)
+    if len(oops) == 0:
+        return 0.0, disposable
     
-    outcomes = []
-    for scenario in scenarios:
-        total_oop = scenario.total_oop + addon_oop
-        ratio = compute_wealth_ratio(
-            disposable_income=disposable_income,
-            total_premium=premium,
-            scenario_oop=total_oop,
-        )
-        outcomes.append(ratio)
+    # Fused ratio/log/mean pass (equal weighting); any zero → -∞
+    expected_log = float(
+        log_wealth_kernel(float(disposable), total_annual_premium(plan, dental, vision), oops)
+    )
+    if expected_log == float("-inf"):
+        return expected_log, 0.0  # GM = 0
     
-    return outcomes
+    # GM = exp(E[log(ratio)]) × disposable
+    return expected_log, math.exp(expected_log) * disposable
+
+
+def compute_expected_log_wealth_batch(
+    plans: Union[Sequence[MedicalPlan], PlanTable],
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
+    baseline_spend: float,
+    after_tax_income: Optional[float] = None,
+    gross_income: Optional[float] = None,
+    tax_rate: Optional[float] = None,
+    dental: Optional[DentalPlan] = None,
+    vision: Optional[VisionPlan] = None,
+) -> np.ndarray:
+    """Compute E[log(W/W₀)] for many plans at once.
+    
+    Batched compute_expected_log_wealth: premiums and scenario OOPs are
+    packed into a plans × scenarios matrix and reduced in one kernel call
+    (parallel over plans when Numba is installed).
+    
+    Args:
+        plans: Medical plans to evaluate, as a list or a prebuilt PlanTable
+        scenarios: Shared list or ScenarioSet for every plan (None = each plan's own)
+        baseline_spend: Fixed non-health spending
+        after_tax_income: Income after taxes (preferred)
+        gross_income: Gross income before taxes
+        tax_rate: Effective tax rate (0.0 to 1.0)
+        dental: Optional dental add-on
+        vision: Optional vision add-on
+        
+    Returns:
+        Array of E[log(W/W₀)], one per plan in input order (-inf = ruin)
+        
+    Example:
+        >>> expected_logs = compute_expected_log_wealth_batch(
+        ...     plans=ALL_PLANS,
+        ...     scenarios=None,
+        ...     baseline_spend=80_000,
+        ...     after_tax_income=180_000,
+        ... )
+    """
+    table = plans if isinstance(plans, PlanTable) else PlanTable.from_plans(plans)
+    disposable = compute_disposable_income(
+        baseline_spend=baseline_spend,
+        after_tax_income=after_tax_income,
+        gross_income=gross_income,
+        tax_rate=tax_rate,
+    )
+    
+    if disposable <= 0:
+        return np.full(len(table), -np.inf)
+    
+    oop = _scenario_oop_matrix(table, scenarios, dental, vision)
+    if oop.shape[1] == 0:
+        return np.zeros(len(table))
+    
+    premiums = total_annual_premiums_vec(table, dental, vision)
+    
+    out = np.empty(len(table))
+    log_wealth_batch(float(disposable), premiums, oop, out)
+    return out
 
 
 # =============================================================================
@@ -223,9 +514,23 @@ def compute_scenario_wealth(
     return annual_income - annual_baseline_spend - total_premium - scenario_oop
 
 
+def _resolve_legacy_income(
+    after_tax_income: Optional[float],
+    baseline_spend: float,
+    annual_income: Optional[float],
+    annual_baseline_spend: Optional[float],
+) -> Tuple[Optional[float], float]:
+    """Map the legacy annual_income / annual_baseline_spend parameters."""
+    if annual_income is not None and after_tax_income is None:
+        after_tax_income = annual_income
+    if annual_baseline_spend is not None and baseline_spend == 0:
+        baseline_spend = annual_baseline_spend
+    return after_tax_income, baseline_spend
+
+
 def compute_expected_log_wealth(
     plan: MedicalPlan,
-    scenarios: List[Scenario],
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
     baseline_spend: float,
     after_tax_income: Optional[float] = None,
     gross_income: Optional[float] = None,
@@ -250,7 +555,7 @@ def compute_expected_log_wealth(
     
     Args:
         plan: Medical plan to evaluate
-        scenarios: List of possible outcomes
+        scenarios: List or ScenarioSet of outcomes (None = the plan's standard scenarios)
         baseline_spend: Fixed non-health spending
         after_tax_income: Income after taxes (preferred)
         gross_income: Gross income before taxes
@@ -271,50 +576,26 @@ def compute_expected_log_wealth(
         ...     scenarios=scenarios,
         ... )
     """
-    # Handle legacy parameters for backward compatibility
-    if annual_income is not None and after_tax_income is None:
-        after_tax_income = annual_income
-    if annual_baseline_spend is not None and baseline_spend == 0:
-        baseline_spend = annual_baseline_spend
+    after_tax_income, baseline_spend = _resolve_legacy_income(
+        after_tax_income, baseline_spend, annual_income, annual_baseline_spend
+    )
     
-    # Compute disposable income
-    disposable = compute_disposable_income(
+    expected_log, _ = compute_wealth_stats(
+        plan=plan,
+        scenarios=scenarios,
         baseline_spend=baseline_spend,
         after_tax_income=after_tax_income,
         gross_income=gross_income,
         tax_rate=tax_rate,
-    )
-    
-    if disposable <= 0:
-        return float("-inf")
-    
-    # Build outcome ratios
-    outcomes = build_scenario_outcomes(
-        disposable_income=disposable,
-        plan=plan,
-        scenarios=scenarios,
         dental=dental,
         vision=vision,
     )
-    
-    if not outcomes:
-        return 0.0
-    
-    # Compute expected log (equal weighting)
-    n = len(outcomes)
-    log_sum = 0.0
-    
-    for ratio in outcomes:
-        if ratio <= 0:
-            return float("-inf")  # Any zero → log = -∞
-        log_sum += math.log(ratio)
-    
-    return log_sum / n
+    return expected_log
 
 
 def compute_geometric_mean_wealth(
     plan: MedicalPlan,
-    scenarios: List[Scenario],
+    scenarios: Optional[Union[List[Scenario], ScenarioSet]],
     baseline_spend: float,
     after_tax_income: Optional[float] = None,
     gross_income: Optional[float] = None,
@@ -335,7 +616,7 @@ def compute_geometric_mean_wealth(
     
     Args:
         plan: Medical plan to evaluate
-        scenarios: List of possible outcomes
+        scenarios: List or ScenarioSet of outcomes (None = the plan's standard scenarios)
         baseline_spend: Fixed non-health spending
         after_tax_income: Income after taxes (preferred)
         gross_income: Gross income before taxes
@@ -348,13 +629,11 @@ def compute_geometric_mean_wealth(
     Returns:
         Geometric mean wealth in dollars
     """
-    # Handle legacy parameters
-    if annual_income is not None and after_tax_income is None:
-        after_tax_income = annual_income
-    if annual_baseline_spend is not None and baseline_spend == 0:
-        baseline_spend = annual_baseline_spend
+    after_tax_income, baseline_spend = _resolve_legacy_income(
+        after_tax_income, baseline_spend, annual_income, annual_baseline_spend
+    )
     
-    expected_log = compute_expected_log_wealth(
+    _, gm = compute_wealth_stats(
         plan=plan,
         scenarios=scenarios,
         baseline_spend=baseline_spend,
@@ -364,17 +643,4 @@ def compute_geometric_mean_wealth(
         dental=dental,
         vision=vision,
     )
-    
-    if expected_log == float("-inf"):
-        return 0.0
-    
-    # Compute disposable for scaling
-    disposable = compute_disposable_income(
-        baseline_spend=baseline_spend,
-        after_tax_income=after_tax_income,
-        gross_income=gross_income,
-        tax_rate=tax_rate,
-    )
-    
-    # GM = exp(E[log(ratio)]) × disposable
-    return math.exp(expected_log) * disposable
+    return gm
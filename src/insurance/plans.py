@@ -15,7 +15,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+def _readonly_f64(values: Union[Sequence[float], np.ndarray]) -> np.ndarray:
+    """values as a read-only float64 array that no caller can write through.
+    
+    Frozen arrays that own their data are kept as is; anything else is
+    copied first, since a writable array (or a view of one) could change
+    under a cache keyed on its holder.
+    """
+    array = np.asarray(values, dtype=np.float64)
+    if array.flags.writeable or array.base is not None:
+        array = array.copy()
+        array.flags.writeable = False
+    return array
 
 
 class NetworkType(Enum):
@@ -34,7 +50,7 @@ class NetworkType(Enum):
     EPO = "epo"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MedicalPlan:
     """Medical insurance plan with cost-sharing details.
     
@@ -84,7 +100,7 @@ class MedicalPlan:
     ground_ambulance_exposure: float = 1_500.0  # Midpoint of $500-$2,000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DentalPlan:
     """Dental insurance add-on.
     
@@ -109,7 +125,7 @@ class DentalPlan:
     expected_oop: float = 200.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VisionPlan:
     """Vision insurance add-on.
     
@@ -133,6 +149,57 @@ class VisionPlan:
     expected_oop: float = 50.0
 
 
+@dataclass(frozen=True, eq=False)
+class PlanTable:
+    """Struct-of-arrays view of a list of medical plans.
+    
+    Holds one contiguous float64 array per hot field so plan sweeps can
+    read each attribute for every plan in a single vector load, instead
+    of walking MedicalPlan objects attribute by attribute. The original
+    plans are kept for scenario construction. Arrays are read-only
+    (writable inputs are copied on construction), since tables key
+    memoized comparisons by identity.
+    
+    Attributes:
+        plans: The medical plans, in table order
+        names: Plan names
+        annual_premium: Medical premium per plan
+        in_network_oop_max: In-network OOP max per plan
+    
+    Example:
+        >>> table = PlanTable.from_plans([gold_ppo, platinum_ppo])
+        >>> table.annual_premium
+        array([24000., 30000.])
+    """
+    
+    plans: Tuple[MedicalPlan, ...]
+    names: Tuple[str, ...]
+    annual_premium: np.ndarray
+    in_network_oop_max: np.ndarray
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "annual_premium", _readonly_f64(self.annual_premium))
+        object.__setattr__(self, "in_network_oop_max", _readonly_f64(self.in_network_oop_max))
+    
+    @classmethod
+    def from_plans(cls, plans: Sequence[MedicalPlan]) -> PlanTable:
+        """Build a table from medical plans (one row per plan)."""
+        def column(attr: str) -> np.ndarray:
+            values = np.array([getattr(p, attr) for p in plans], dtype=np.float64)
+            values.flags.writeable = False
+            return values
+        
+        return cls(
+            plans=tuple(plans),
+            names=tuple(p.name for p in plans),
+            annual_premium=column("annual_premium"),
+            in_network_oop_max=column("in_network_oop_max"),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.plans)
+
+
 def total_annual_premium(
     medical: MedicalPlan,
     dental: Optional[DentalPlan] = None,
@@ -161,3 +228,41 @@ def total_annual_premium(
         total += vision.annual_premium
     
     return total
+
+
+def total_annual_premiums_vec(
+    plans: Union[Sequence[MedicalPlan], PlanTable],
+    dental: Optional[DentalPlan] = None,
+    vision: Optional[VisionPlan] = None,
+) -> np.ndarray:
+    """Calculate total annual premium for many medical plans at once.
+    
+    Vectorized total_annual_premium: the add-on premiums are the same for
+    every plan, so each is one broadcast add over the premium column.
+    
+    Args:
+        plans: Medical plans, as a list or a prebuilt PlanTable
+        dental: Optional dental add-on
+        vision: Optional vision add-on
+        
+    Returns:
+        Array of total annual premiums, one per plan in input order
+        
+    Example:
+        >>> totals = total_annual_premiums_vec(ALL_PLANS, dental, vision)
+    """
+    totals: np.ndarray
+    if isinstance(plans, PlanTable):
+        totals = plans.annual_premium.copy()
+    else:
+        totals = np.fromiter(
+            (p.annual_premium for p in plans), dtype=np.float64, count=len(plans)
+        )
+    
+    if dental is not None:
+        totals += dental.annual_premium
+    
+    if vision is not None:
+        totals += vision.annual_premium
+    
+    return totals
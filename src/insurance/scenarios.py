@@ -7,13 +7,17 @@ rather than probability-weighted expectations.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Sequence, Tuple
 
-from src.insurance.plans import MedicalPlan
+import numpy as np
 
+from src.insurance.plans import MedicalPlan, _readonly_f64
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Scenario:
     """A possible healthcare outcome scenario.
     
@@ -21,11 +25,14 @@ class Scenario:
     is for reference/documentation only - actual calculation uses equal
     weighting (Spitznagel's approach).
     
+    Frozen so that cached scenario lists can be shared between callers.
+    
     Attributes:
         name: Scenario identifier
         probability: Reference probability (not used in calculation)
         medical_oop: Out-of-pocket medical costs for this scenario
         extra_oon: Additional out-of-network costs (e.g., post-stabilization)
+        total_oop: medical_oop + extra_oon (derived, not an init argument)
     
     Example:
         >>> catastrophe = Scenario(
@@ -39,11 +46,76 @@ class Scenario:
     probability: float  # Reference only - we use equal weighting
     medical_oop: float
     extra_oon: float = 0.0
+    # Derived once at construction: read per scenario on every evaluation
+    total_oop: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "total_oop", self.medical_oop + self.extra_oon)
+    
+    @staticmethod
+    def pack_total_oop(scenarios: Sequence[Scenario]) -> np.ndarray:
+        """Pack total_oop of each scenario into a float64 array, in order."""
+        return np.fromiter(
+            (s.total_oop for s in scenarios), dtype=np.float64, count=len(scenarios)
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class ScenarioSet:
+    """Scenarios stored as parallel arrays (struct-of-arrays).
+    
+    Holds the same data as a list of Scenario objects, but with each
+    field in a contiguous float64 array so the hot path reads OOPs
+    without touching Scenario objects. Arrays are read-only (writable
+    inputs are copied on construction), and sets hash by identity, so a
+    ScenarioSet can key memoized evaluations.
+    
+    Attributes:
+        names: Scenario identifiers, in order
+        medical_oop: Out-of-pocket medical costs per scenario
+        extra_oon: Additional out-of-network costs per scenario
+    
+    Example:
+        >>> scenario_set = ScenarioSet.for_plan(gold_ppo)
+        >>> scenario_set.total_oop
+        array([    0.,   400., 18400., 19900.])
+    """
+    
+    names: Tuple[str, ...]
+    medical_oop: np.ndarray
+    extra_oon: np.ndarray
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "medical_oop", _readonly_f64(self.medical_oop))
+        object.__setattr__(self, "extra_oon", _readonly_f64(self.extra_oon))
+    
+    @classmethod
+    def from_scenarios(cls, scenarios: Sequence[Scenario]) -> ScenarioSet:
+        """Pack a list of Scenario objects into parallel (read-only) arrays."""
+        n = len(scenarios)
+        medical_oop = np.fromiter((s.medical_oop for s in scenarios), np.float64, count=n)
+        extra_oon = np.fromiter((s.extra_oon for s in scenarios), np.float64, count=n)
+        medical_oop.flags.writeable = False
+        extra_oon.flags.writeable = False
+        return cls(
+            names=tuple(s.name for s in scenarios),
+            medical_oop=medical_oop,
+            extra_oon=extra_oon,
+        )
+    
+    @classmethod
+    def for_plan(cls, plan: MedicalPlan) -> ScenarioSet:
+        """The plan's standard scenarios (cached, with read-only arrays)."""
+        return _build_scenario_set(_scenario_key(plan))
     
     @property
-    def total_oop(self) -> float:
-        """Total out-of-pocket including extra OON costs."""
-        return self.medical_oop + self.extra_oon
+    def total_oop(self) -> np.ndarray:
+        """Total out-of-pocket per scenario including extra OON costs."""
+        total: np.ndarray = self.medical_oop + self.extra_oon
+        return total
+    
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 # Default scenario probabilities (for reference - not used in calculation)
@@ -54,6 +126,12 @@ DEFAULT_PROBABILITIES = {
     "cat_oon_emergency": 0.02,
 }
 
+# Bound once for the scenario builder (DEFAULT_PROBABILITIES stays the public view)
+_P_NO_USE, _P_MINOR, _P_CAT_IN, _P_CAT_OON = (
+    DEFAULT_PROBABILITIES[k]
+    for k in ("no_use", "minor_use", "cat_in_network", "cat_oon_emergency")
+)
+
 
 def build_scenarios_for_plan(plan: MedicalPlan) -> List[Scenario]:
     """Build scenario list with plan-specific OOP values.
@@ -66,6 +144,10 @@ def build_scenarios_for_plan(plan: MedicalPlan) -> List[Scenario]:
     3. cat_in_network: plan.in_network_oop_max (catastrophe in-network)
     4. cat_oon_emergency: OOP max + post-stabilization exposure
     
+    Results are cached on the plan fields that feed the scenarios, so
+    repeated calls for the same plan (or an identically structured one)
+    skip reconstruction.
+    
     Args:
         plan: Medical plan to build scenarios for
         
@@ -77,12 +159,132 @@ def build_scenarios_for_plan(plan: MedicalPlan) -> List[Scenario]:
         >>> for s in scenarios:
         ...     print(f"{s.name}: ${s.total_oop:,.0f}")
     """
+    return list(_build_scenarios(_scenario_key(plan)))
+
+
+def scenarios_by_name(plan: MedicalPlan) -> Mapping[str, Scenario]:
+    """The plan's standard scenarios keyed by name.
+    
+    Same Scenario objects as build_scenarios_for_plan, for picking one
+    scenario without scanning the list. Cached, so the mapping is shared
+    and read-only.
+    
+    Args:
+        plan: Medical plan to build scenarios for
+        
+    Returns:
+        Read-only mapping from scenario name to Scenario, in scenario order
+        
+    Example:
+        >>> scenarios_by_name(gold_ppo)["cat_oon_emergency"].total_oop
+        19900.0
+    """
+    return _scenario_map(_scenario_key(plan))
+
+
+def build_scenario_matrix(plans: Sequence[MedicalPlan]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build the standard scenarios for many plans as (plans, 4) arrays.
+    
+    Array form of build_scenarios_for_plan: row i, column j holds plan i's
+    value for scenario j, in the same scenario order. The scenario logic
+    runs as whole-column NumPy operations rather than per plan.
+    
+    Args:
+        plans: Medical plans to build scenarios for
+        
+    Returns:
+        Tuple of (medical_oop, extra_oon), each of shape (len(plans), 4)
+        
+    Example:
+        >>> medical_oop, extra_oon = build_scenario_matrix(ALL_PLANS)
+        >>> total_oop = medical_oop + extra_oon
+    """
+    def column(attr: str, dtype: type = np.float64) -> np.ndarray:
+        return np.fromiter((getattr(p, attr) for p in plans), dtype=dtype, count=len(plans))
+    
+    oop_max = column("in_network_oop_max")
+    zeros = np.zeros(len(plans))
+    
+    # OON emergency: in-network cost-sharing (No Surprises Act) or 2× estimate
+    emergency_oop = np.where(
+        column("oon_emergency_treated_as_in_network", bool), oop_max, oop_max * 2
+    )
+    # Uncovered post-stabilization exposure plus (never protected) ground ambulance
+    post_stab_extra = np.where(
+        column("post_stabilization_oon_covered", bool), 0.0, column("post_stabilization_exposure")
+    )
+    oon_extra = post_stab_extra + column("ground_ambulance_exposure")
+    
+    medical_oop = np.column_stack([zeros, column("expected_minor_oop"), oop_max, emergency_oop])
+    extra_oon = np.column_stack([zeros, zeros, zeros, oon_extra])
+    return medical_oop, extra_oon
+
+
+def plan_total_oop(plan: MedicalPlan) -> np.ndarray:
+    """Total OOP per standard scenario for a plan, as a float64 array.
+    
+    Same order as build_scenarios_for_plan. Cached alongside the scenarios
+    themselves, so the returned array is shared and read-only.
+    
+    Args:
+        plan: Medical plan to build scenarios for
+        
+    Returns:
+        Array of shape (4,) with each scenario's total_oop
+    """
+    return _pack_total_oop(_scenario_key(plan))
+
+
+def _scenario_key(plan: MedicalPlan) -> Tuple[float, float, bool, bool, float, float]:
+    """The plan fields that feed scenario construction (the cache key)."""
+    return (
+        plan.expected_minor_oop,
+        plan.in_network_oop_max,
+        plan.oon_emergency_treated_as_in_network,
+        plan.post_stabilization_oon_covered,
+        plan.post_stabilization_exposure,
+        plan.ground_ambulance_exposure,
+    )
+
+
+@lru_cache(maxsize=64)
+def _build_scenario_set(key: Tuple[float, float, bool, bool, float, float]) -> ScenarioSet:
+    """ScenarioSet for the cached scenarios of a key."""
+    return ScenarioSet.from_scenarios(_build_scenarios(key))
+
+
+@lru_cache(maxsize=64)
+def _scenario_map(key: Tuple[float, float, bool, bool, float, float]) -> Mapping[str, Scenario]:
+    """Name-keyed view of the cached scenarios of a key."""
+    return MappingProxyType({s.name: s for s in _build_scenarios(key)})
+
+
+@lru_cache(maxsize=64)
+def _pack_total_oop(key: Tuple[float, float, bool, bool, float, float]) -> np.ndarray:
+    """Packed total_oop for the cached scenarios of a key."""
+    packed = Scenario.pack_total_oop(_build_scenarios(key))
+    packed.flags.writeable = False
+    return packed
+
+
+@lru_cache(maxsize=64)
+def _build_scenarios(key: Tuple[float, float, bool, bool, float, float]) -> Tuple[Scenario, ...]:
+    """Build the four standard scenarios from a plan's scenario fields."""
+    (
+        expected_minor_oop,
+        in_network_oop_max,
+        oon_emergency_treated_as_in_network,
+        post_stabilization_oon_covered,
+        post_stabilization_exposure,
+        ground_ambulance_exposure,
+    ) = key
+    
     scenarios = []
     
     # Scenario 1: No healthcare use (healthy year)
     scenarios.append(Scenario(
         name="no_use",
-        probability=DEFAULT_PROBABILITIES["no_use"],
+        probability=_P_NO_USE,
         medical_oop=0.0,
         extra_oon=0.0,
     ))
@@ -90,43 +292,43 @@ def build_scenarios_for_plan(plan: MedicalPlan) -> List[Scenario]:
     # Scenario 2: Minor use (typical year - checkups, minor issues)
     scenarios.append(Scenario(
         name="minor_use",
-        probability=DEFAULT_PROBABILITIES["minor_use"],
-        medical_oop=plan.expected_minor_oop,
+        probability=_P_MINOR,
+        medical_oop=expected_minor_oop,
         extra_oon=0.0,
     ))
     
     # Scenario 3: Catastrophic event, in-network (surgery, hospitalization)
     scenarios.append(Scenario(
         name="cat_in_network",
-        probability=DEFAULT_PROBABILITIES["cat_in_network"],
-        medical_oop=plan.in_network_oop_max,
+        probability=_P_CAT_IN,
+        medical_oop=in_network_oop_max,
         extra_oon=0.0,
     ))
     
     # Scenario 4: Catastrophic event, out-of-network (Colorado accident)
     # Emergency portion treated as in-network (No Surprises Act)
     # Post-stabilization may not be covered
-    if plan.oon_emergency_treated_as_in_network:
-        emergency_oop = plan.in_network_oop_max
+    if oon_emergency_treated_as_in_network:
+        emergency_oop = in_network_oop_max
     else:
         # Would need separate OON OOP max - rare on exchange plans
-        emergency_oop = plan.in_network_oop_max * 2  # Conservative estimate
+        emergency_oop = in_network_oop_max * 2  # Conservative estimate
     
     # Post-stabilization exposure (if not covered by plan)
-    if plan.post_stabilization_oon_covered:
+    if post_stabilization_oon_covered:
         post_stab_extra = 0.0
     else:
-        post_stab_extra = plan.post_stabilization_exposure
+        post_stab_extra = post_stabilization_exposure
     
     # Ground ambulance is NOT protected by No Surprises Act
     # Always add this exposure for OON scenarios
-    ground_ambulance = plan.ground_ambulance_exposure
+    ground_ambulance = ground_ambulance_exposure
     
     scenarios.append(Scenario(
         name="cat_oon_emergency",
-        probability=DEFAULT_PROBABILITIES["cat_oon_emergency"],
+        probability=_P_CAT_OON,
         medical_oop=emergency_oop,
         extra_oon=post_stab_extra + ground_ambulance,
     ))
     
-    return scenarios
+    return tuple(scenarios)
@@ -0,0 +1,83 @@
+"""Parameter sweeps for plan comparison.
+
+compare_plans scores plans for one financial situation. A sweep scores
+the same plans across many incomes at once (e.g. to see where the best
+plan changes), returning a plain incomes × plans array of GM wealth
+instead of result objects.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.insurance._kernels import gm_sweep
+from src.insurance._plan_arrays import plan_arrays, plans_key, scenarios_key
+from src.insurance.geometric_mean import disposable_from_after_tax, disposable_from_gross
+from src.insurance.plans import (
+    MedicalPlan,
+    DentalPlan,
+    VisionPlan,
+    PlanTable,
+    total_annual_premiums_vec,
+)
+from src.insurance.scenarios import Scenario
+
+
+def compare_plans_sweep(
+    plans: Union[List[MedicalPlan], PlanTable],
+    annual_incomes: Sequence[float],
+    annual_baseline_spend: float,
+    dental: Optional[DentalPlan] = None,
+    vision: Optional[VisionPlan] = None,
+    scenarios: Optional[List[Scenario]] = None,
+    tax_rate: Optional[float] = None,
+) -> np.ndarray:
+    """Geometric mean wealth of every plan at every income.
+    
+    Same model as compare_plans, evaluated for each income in one kernel
+    call (parallel over incomes when Numba is installed).
+    
+    Args:
+        plans: Medical plans to compare, as a list or a prebuilt PlanTable
+        annual_incomes: Gross annual incomes (or after-tax if tax_rate=None)
+        annual_baseline_spend: Fixed non-health spending
+        dental: Optional dental add-on (applied to all plans)
+        vision: Optional vision add-on (applied to all plans)
+        scenarios: Custom scenarios (if None, builds from each plan)
+        tax_rate: Optional tax rate (if provided, annual_incomes are gross)
+        
+    Returns:
+        Array of shape (len(annual_incomes), len(plans)) of GM wealth in
+        dollars, plans in input order (not ranked)
+        
+    Example:
+        >>> gm = compare_plans_sweep(
+        ...     plans=ALL_PLANS,
+        ...     annual_incomes=np.arange(150_000, 300_001, 10_000),
+        ...     annual_baseline_spend=80_000,
+        ... )
+        >>> best = gm.argmax(axis=1)  # index of the best plan at each income
+    """
+    table, oop, _ = plan_arrays(plans_key(plans), scenarios_key(scenarios))
+    
+    incomes = np.asarray(annual_incomes, dtype=np.float64)
+    if tax_rate is not None:
+        disposables = disposable_from_gross(incomes, tax_rate, annual_baseline_spend)
+    else:
+        # Assume annual_incomes are already after-tax
+        disposables = disposable_from_after_tax(incomes, annual_baseline_spend)
+    
+    addon_oop = 0.0
+    if dental:
+        addon_oop += dental.expected_oop
+    if vision:
+        addon_oop += vision.expected_oop
+    
+    oop = oop + addon_oop  # the cached matrix is read-only
+    
+    out = np.empty((len(incomes), len(table)))
+    if out.size:
+        gm_sweep(disposables, total_annual_premiums_vec(table, dental, vision), oop, out)
+    return out
@@ -2,6 +2,9 @@
 
 Fixtures use the shared data module (src/insurance/data.py) to avoid DRY violations.
 All values are from Covered California 2026 research (Jan 2026).
+
+Plans and scenarios are frozen dataclasses, so every fixture is
+session-scoped: each object is built once and shared by all tests.
 """
 
 import pytest
@@ -26,43 +29,43 @@ from src.insurance.data import (
 # Plan Fixtures - Using shared data module (Single Source of Truth)
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kaiser_gold_hmo() -> MedicalPlan:
     """Kaiser Permanente Gold HMO - lowest premium, integrated network."""
     return KAISER_GOLD_HMO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kaiser_platinum_hmo() -> MedicalPlan:
     """Kaiser Permanente Platinum HMO - lower OOP max, higher premium."""
     return KAISER_PLATINUM_HMO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blue_shield_trio_gold_hmo() -> MedicalPlan:
     """Blue Shield Trio Gold HMO - narrow network (UCSF, Dignity)."""
     return BLUE_SHIELD_TRIO_GOLD_HMO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def blue_shield_trio_platinum_hmo() -> MedicalPlan:
     """Blue Shield Trio Platinum HMO - ChatGPT's recommended plan."""
     return BLUE_SHIELD_TRIO_PLATINUM_HMO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gold_ppo_plan() -> MedicalPlan:
     """Blue Shield Gold 80 PPO - broad network, OON coverage exists."""
     return BLUE_SHIELD_GOLD_PPO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def platinum_ppo_plan() -> MedicalPlan:
     """Blue Shield Platinum 90 PPO - richest benefits, highest premium."""
     return BLUE_SHIELD_PLATINUM_PPO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anthem_gold_epo() -> MedicalPlan:
     """Anthem Blue Cross Gold EPO - broad network, no OON coverage."""
     # EPO not in shared data yet - keep inline for now
@@ -83,13 +86,33 @@ def anthem_gold_epo() -> MedicalPlan:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def oon_emergency_uncovered_plan() -> MedicalPlan:
+    """Hypothetical PPO that does NOT treat OON emergencies as in-network."""
+    return MedicalPlan(
+        name="Weird Plan",
+        annual_premium=20_000,
+        in_network_oop_max=10_000,
+        network_type=NetworkType.PPO,
+        deductible=0,
+        expected_minor_oop=300,
+        oon_emergency_treated_as_in_network=False,
+        post_stabilization_oon_covered=False,
+        post_stabilization_exposure=15_000,
+        oon_deductible=5_000,
+        oon_oop_max=25_000,
+        oon_coinsurance=0.5,
+        ground_ambulance_exposure=1_500,
+    )
+
+
+@pytest.fixture(scope="session")
 def basic_dental() -> DentalPlan:
     """Delta Dental PPO from Covered California."""
     return DELTA_DENTAL
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def basic_vision() -> VisionPlan:
     """VSP Vision from Covered California."""
     return VSP_VISION
@@ -99,7 +122,7 @@ def basic_vision() -> VisionPlan:
 # Scenario Fixtures - Updated with Research Findings
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def no_use_scenario() -> Scenario:
     """Healthy year - no healthcare usage (70% probability)."""
     return Scenario(
@@ -109,7 +132,7 @@ def no_use_scenario() -> Scenario:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minor_use_scenario() -> Scenario:
     """Typical year - some doctor visits, prescriptions (25% probability)."""
     return Scenario(
@@ -119,7 +142,7 @@ def minor_use_scenario() -> Scenario:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def high_use_scenario() -> Scenario:
     """High cost year - one person hits significant costs (8% probability)."""
     return Scenario(
@@ -129,7 +152,7 @@ def high_use_scenario() -> Scenario:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cat_in_network_scenario() -> Scenario:
     """Catastrophic event in-network - both hit OOP max (3% probability)."""
     return Scenario(
@@ -139,7 +162,7 @@ def cat_in_network_scenario() -> Scenario:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cat_oon_scenario() -> Scenario:
     """Catastrophic event out-of-network (Colorado skiing accident).
     
@@ -159,7 +182,7 @@ def cat_oon_scenario() -> Scenario:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_scenarios(
     no_use_scenario,
     minor_use_scenario,
@@ -179,19 +202,25 @@ def default_scenarios(
 # Financial Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def typical_couple_income() -> float:
     """Typical SF couple household income (no subsidies at this level)."""
     return 240_000.0
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def typical_baseline_spend() -> float:
     """Typical annual baseline spending (rent, food, etc.)."""
     return 120_000.0
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def typical_disposable_income(typical_couple_income, typical_baseline_spend) -> float:
+    """Disposable income for the typical couple (income treated as after-tax)."""
+    return typical_couple_income - typical_baseline_spend
+
+
+@pytest.fixture(scope="session")
 def typical_tax_rate() -> float:
     """Effective tax rate for SF couple at $240k income."""
     return 0.35  # ~35% federal + state + FICA
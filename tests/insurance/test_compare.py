@@ -21,24 +21,36 @@ class TestComparePlansExists:
         assert PlanComparisonResult is not None
 
 
+@pytest.fixture(scope="module")
+def gold_vs_platinum_results(
+    gold_ppo_plan, platinum_ppo_plan, typical_couple_income, typical_baseline_spend
+):
+    """Gold vs Platinum PPO comparison, computed once for this module."""
+    from src.insurance.compare import compare_plans
+    
+    return compare_plans(
+        plans=[gold_ppo_plan, platinum_ppo_plan],
+        annual_income=typical_couple_income,
+        annual_baseline_spend=typical_baseline_spend,
+    )
+
+
+@pytest.fixture(scope="module")
+def comparison_table(gold_vs_platinum_results):
+    """Markdown table for the Gold vs Platinum comparison."""
+    from src.insurance.compare import format_comparison_table
+    
+    return format_comparison_table(gold_vs_platinum_results)
+
+
 class TestComparePlans:
     """Test plan comparison functionality."""
 
-    def test_compare_returns_list_of_results(
-        self, 
-        gold_ppo_plan, 
-        platinum_ppo_plan,
-        typical_couple_income,
-        typical_baseline_spend
-    ):
+    def test_compare_returns_list_of_results(self, gold_vs_platinum_results):
         """compare_plans should return a list of PlanComparisonResult."""
-        from src.insurance.compare import compare_plans, PlanComparisonResult
+        from src.insurance.compare import PlanComparisonResult
         
-        results = compare_plans(
-            plans=[gold_ppo_plan, platinum_ppo_plan],
-            annual_income=typical_couple_income,
-            annual_baseline_spend=typical_baseline_spend,
-        )
+        results = gold_vs_platinum_results
         
         assert isinstance(results, list)
         assert len(results) == 2
@@ -65,43 +77,21 @@ class TestComparePlans:
         assert gms == sorted(gms, reverse=True), "Results should be sorted by GM descending"
 
     def test_result_contains_plan_name(
-        self, 
-        gold_ppo_plan,
-        typical_couple_income,
-        typical_baseline_spend
+        self, gold_vs_platinum_results, gold_ppo_plan, platinum_ppo_plan
     ):
         """Result should contain the plan name."""
-        from src.insurance.compare import compare_plans
-        
-        results = compare_plans(
-            plans=[gold_ppo_plan],
-            annual_income=typical_couple_income,
-            annual_baseline_spend=typical_baseline_spend,
-        )
+        names = {r.plan_name for r in gold_vs_platinum_results}
         
-        assert results[0].plan_name == gold_ppo_plan.name
+        assert names == {gold_ppo_plan.name, platinum_ppo_plan.name}
 
-    def test_result_contains_key_metrics(
-        self, 
-        gold_ppo_plan,
-        typical_couple_income,
-        typical_baseline_spend
-    ):
+    def test_result_contains_key_metrics(self, gold_vs_platinum_results):
         """Result should contain annual_premium, oop_max, and geometric_mean."""
-        from src.insurance.compare import compare_plans
-        
-        results = compare_plans(
-            plans=[gold_ppo_plan],
-            annual_income=typical_couple_income,
-            annual_baseline_spend=typical_baseline_spend,
-        )
-        
-        r = results[0]
-        assert hasattr(r, "plan_name")
-        assert hasattr(r, "annual_premium")
-        assert hasattr(r, "in_network_oop_max")
-        assert hasattr(r, "geometric_mean")
-        assert hasattr(r, "expected_log_wealth")
+        for r in gold_vs_platinum_results:
+            assert hasattr(r, "plan_name")
+            assert hasattr(r, "annual_premium")
+            assert hasattr(r, "in_network_oop_max")
+            assert hasattr(r, "geometric_mean")
+            assert hasattr(r, "expected_log_wealth")
 
 
 class TestCompareWithAddons:
@@ -160,44 +150,16 @@ class TestComparisonTable:
         from src.insurance.compare import format_comparison_table
         assert callable(format_comparison_table)
 
-    def test_format_table_returns_string(
-        self, 
-        gold_ppo_plan, 
-        platinum_ppo_plan,
-        typical_couple_income,
-        typical_baseline_spend
-    ):
+    def test_format_table_returns_string(self, comparison_table):
         """Should return a formatted string table."""
-        from src.insurance.compare import compare_plans, format_comparison_table
-        
-        results = compare_plans(
-            plans=[gold_ppo_plan, platinum_ppo_plan],
-            annual_income=typical_couple_income,
-            annual_baseline_spend=typical_baseline_spend,
-        )
-        
-        table = format_comparison_table(results)
+        table = comparison_table
         
         assert isinstance(table, str)
         assert "Gold" in table or "Blue Shield" in table  # Should contain plan names
 
-    def test_format_table_is_markdown(
-        self, 
-        gold_ppo_plan, 
-        platinum_ppo_plan,
-        typical_couple_income,
-        typical_baseline_spend
-    ):
+    def test_format_table_is_markdown(self, comparison_table):
         """Table should be markdown formatted."""
-        from src.insurance.compare import compare_plans, format_comparison_table
-        
-        results = compare_plans(
-            plans=[gold_ppo_plan, platinum_ppo_plan],
-            annual_income=typical_couple_income,
-            annual_baseline_spend=typical_baseline_spend,
-        )
-        
-        table = format_comparison_table(results)
+        table = comparison_table
         
         # Markdown tables have | and - characters
         assert "|" in table
@@ -227,3 +189,211 @@ class TestScenarioBreakdown:
         assert isinstance(r.scenario_wealth, dict)
         assert "no_use" in r.scenario_wealth
         assert "cat_in_network" in r.scenario_wealth
+
+    def test_constructor_accepts_scenario_dicts(self):
+        """The scenario_wealth/scenario_ratios dict kwargs still build a result."""
+        import numpy as np
+        from src.insurance.compare import PlanComparisonResult
+        
+        scalars = dict(
+            plan_name="Test Plan",
+            annual_premium=20_000,
+            total_annual_premium=21_000,
+            in_network_oop_max=10_000,
+            expected_log_wealth=-0.5,
+            geometric_mean=50_000,
+        )
+        from_dicts = PlanComparisonResult(
+            **scalars,
+            scenario_wealth={"no_use": 80_000, "catastrophe": 50_000},
+            scenario_ratios={"no_use": 0.8},
+        )
+        from_arrays = PlanComparisonResult(
+            **scalars,
+            scenario_names=("no_use", "catastrophe"),
+            scenario_wealth_arr=np.array([80_000.0, 50_000.0]),
+            scenario_ratios_arr=np.array([0.8, 0.0]),
+        )
+        
+        assert from_dicts.scenario_wealth == {"no_use": 80_000, "catastrophe": 50_000}
+        assert from_dicts.scenario_ratios == {"no_use": 0.8, "catastrophe": 0.0}
+        assert from_dicts == from_arrays
+        with pytest.raises(TypeError):
+            PlanComparisonResult(
+                **scalars, scenario_wealth={"no_use": 1.0}, scenario_names=("no_use",)
+            )
+
+
+class TestVectorizedMatchesScalar:
+    """Vectorized compare_plans should agree with the per-plan scalar functions."""
+
+    def test_gm_matches_scalar_path(
+        self,
+        gold_ppo_plan,
+        platinum_ppo_plan,
+        kaiser_gold_hmo,
+        basic_dental,
+        basic_vision,
+        typical_couple_income,
+        typical_baseline_spend
+    ):
+        """GM and E[log(W)] should match compute_geometric_mean_wealth per plan."""
+        from src.insurance.compare import compare_plans
+        from src.insurance.geometric_mean import (
+            compute_expected_log_wealth,
+            compute_geometric_mean_wealth,
+        )
+        from src.insurance.scenarios import build_scenarios_for_plan
+        
+        plans = [gold_ppo_plan, platinum_ppo_plan, kaiser_gold_hmo]
+        results = compare_plans(
+            plans=plans,
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+            dental=basic_dental,
+            vision=basic_vision,
+        )
+        
+        by_name = {r.plan_name: r for r in results}
+        for plan in plans:
+            kwargs = dict(
+                plan=plan,
+                scenarios=build_scenarios_for_plan(plan),
+                baseline_spend=typical_baseline_spend,
+                after_tax_income=typical_couple_income,
+                dental=basic_dental,
+                vision=basic_vision,
+            )
+            r = by_name[plan.name]
+            assert r.geometric_mean == pytest.approx(compute_geometric_mean_wealth(**kwargs))
+            assert r.expected_log_wealth == pytest.approx(compute_expected_log_wealth(**kwargs))
+
+    def test_plan_table_matches_list(
+        self,
+        gold_ppo_plan,
+        kaiser_gold_hmo,
+        typical_couple_income,
+        typical_baseline_spend
+    ):
+        """compare_plans should accept a prebuilt PlanTable."""
+        from src.insurance.compare import compare_plans
+        from src.insurance.plans import PlanTable
+        
+        plans = [gold_ppo_plan, kaiser_gold_hmo]
+        from_list = compare_plans(
+            plans=plans,
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+        )
+        from_table = compare_plans(
+            plans=PlanTable.from_plans(plans),
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+        )
+        
+        assert [r.plan_name for r in from_table] == [r.plan_name for r in from_list]
+        assert [r.geometric_mean for r in from_table] == [r.geometric_mean for r in from_list]
+
+    def test_ruined_plan_has_zero_gm(self, gold_ppo_plan):
+        """A plan whose costs exceed disposable income should get GM = 0."""
+        from src.insurance.compare import compare_plans
+        
+        results = compare_plans(
+            plans=[gold_ppo_plan],
+            annual_income=50_000,
+            annual_baseline_spend=20_000,
+        )
+        
+        assert results[0].geometric_mean == 0.0
+        assert results[0].expected_log_wealth == float("-inf")
+
+    def test_empty_plan_list(self, typical_couple_income, typical_baseline_spend):
+        """Comparing no plans should return an empty list."""
+        from src.insurance.compare import compare_plans
+        
+        assert compare_plans(
+            plans=[],
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+        ) == []
+
+    def test_ties_keep_input_order(
+        self, gold_ppo_plan, typical_couple_income, typical_baseline_spend
+    ):
+        """Plans with equal geometric means should stay in input order."""
+        from dataclasses import replace
+        from src.insurance.compare import compare_plans
+        
+        twin = replace(gold_ppo_plan, name="Gold PPO Twin")
+        results = compare_plans(
+            plans=[gold_ppo_plan, twin],
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+        )
+        
+        assert [r.plan_name for r in results] == [gold_ppo_plan.name, "Gold PPO Twin"]
+
+    def test_repeated_comparison_is_cached(
+        self, gold_ppo_plan, kaiser_gold_hmo, typical_couple_income, typical_baseline_spend
+    ):
+        """Identical inputs should hit the cache but still return a fresh list."""
+        from src.insurance.compare import _compare_plans_cached, compare_plans
+        
+        kwargs = dict(
+            plans=[gold_ppo_plan, kaiser_gold_hmo],
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+        )
+        
+        first = compare_plans(**kwargs)
+        hits = _compare_plans_cached.cache_info().hits
+        second = compare_plans(**kwargs)
+        
+        assert _compare_plans_cached.cache_info().hits == hits + 1
+        assert second == first
+        assert second is not first
+        assert not first[0].scenario_wealth_arr.flags.writeable
+
+    def test_numpy_scalar_income_matches_float(
+        self, gold_ppo_plan, typical_couple_income, typical_baseline_spend
+    ):
+        """A 0-d array income (unhashable) is compared without the cache."""
+        import numpy as np
+        from src.insurance.compare import compare_plans
+        
+        kwargs = dict(plans=[gold_ppo_plan], annual_baseline_spend=typical_baseline_spend)
+        
+        assert compare_plans(
+            annual_income=np.array(typical_couple_income), **kwargs
+        )[0].geometric_mean == compare_plans(
+            annual_income=typical_couple_income, **kwargs
+        )[0].geometric_mean
+
+    def test_results_are_frozen(self, gold_ppo_plan, typical_couple_income, typical_baseline_spend):
+        """Cached results are shared between callers, so they must be immutable."""
+        from dataclasses import FrozenInstanceError
+        from src.insurance.compare import compare_plans
+        
+        result = compare_plans(
+            plans=[gold_ppo_plan],
+            annual_income=typical_couple_income,
+            annual_baseline_spend=typical_baseline_spend,
+        )[0]
+        
+        with pytest.raises(FrozenInstanceError):
+            result.geometric_mean = 0.0
+
+    def test_plan_arrays_shared_across_incomes(
+        self, gold_ppo_plan, kaiser_gold_hmo, typical_baseline_spend
+    ):
+        """A new income misses the result cache but reuses the plan arrays."""
+        from src.insurance._plan_arrays import plan_arrays
+        from src.insurance.compare import compare_plans
+        
+        plans = [gold_ppo_plan, kaiser_gold_hmo]
+        compare_plans(plans, 250_000, typical_baseline_spend)
+        hits = plan_arrays.cache_info().hits
+        compare_plans(plans, 251_000, typical_baseline_spend)
+        
+        assert plan_arrays.cache_info().hits == hits + 1
+        assert not plan_arrays(tuple(plans), None).oop.flags.writeable
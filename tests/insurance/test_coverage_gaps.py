@@ -5,8 +5,7 @@ These tests target specific uncovered lines identified by coverage analysis.
 
 import pytest
 
-from src.insurance.plans import MedicalPlan, NetworkType
-from src.insurance.scenarios import Scenario, build_scenarios_for_plan
+from src.insurance.scenarios import Scenario, build_scenarios_for_plan, scenarios_by_name
 from src.insurance.geometric_mean import (
     compute_wealth_ratio,
     compute_geometric_mean_ratio,
@@ -197,28 +196,12 @@ class TestGeometricMeanEdgeCases:
 class TestOONEmergencyNotInNetwork:
     """Tests for oon_emergency_treated_as_in_network=False branch (line 113)."""
 
-    def test_oon_emergency_not_treated_as_in_network(self):
+    def test_oon_emergency_not_treated_as_in_network(self, oon_emergency_uncovered_plan):
         """Plans with OON emergency NOT treated as in-network should double OOP estimate."""
-        plan = MedicalPlan(
-            name="Weird Plan",
-            annual_premium=20_000,
-            in_network_oop_max=10_000,
-            network_type=NetworkType.PPO,
-            deductible=0,
-            expected_minor_oop=300,
-            oon_emergency_treated_as_in_network=False,  # Triggers line 113
-            post_stabilization_oon_covered=False,
-            post_stabilization_exposure=15_000,
-            oon_deductible=5_000,
-            oon_oop_max=25_000,
-            oon_coinsurance=0.5,
-            ground_ambulance_exposure=1_500,
-        )
-        
-        scenarios = build_scenarios_for_plan(plan)
+        plan = oon_emergency_uncovered_plan  # oon_emergency_treated_as_in_network=False
         
-        # Find the OON emergency scenario
-        oon_scenario = next(s for s in scenarios if s.name == "cat_oon_emergency")
+        # Look up the OON emergency scenario by name
+        oon_scenario = scenarios_by_name(plan)["cat_oon_emergency"]
         
         # Should use 2x the in-network OOP max (conservative estimate)
         # medical_oop = 10,000 * 2 = 20,000
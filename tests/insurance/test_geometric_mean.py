@@ -37,7 +37,7 @@ class TestExpectedLogWealthExists:
 class TestExpectedLogWealthMath:
     """Test the mathematical properties of expected log-wealth."""
 
-    def test_no_cost_scenario_gives_zero_log(self, typical_couple_income, typical_baseline_spend):
+    def test_no_cost_scenario_gives_zero_log(self, typical_disposable_income):
         """If no costs at all, relative wealth = 1, log = 0."""
         from src.insurance.geometric_mean import compute_scenario_wealth, compute_wealth_ratio
         from src.insurance.plans import MedicalPlan
@@ -54,7 +54,7 @@ class TestExpectedLogWealthMath:
         no_cost_scenario = Scenario("no_cost", 1.0, medical_oop=0.0)
         
         # Using new ratio function
-        disposable = typical_couple_income - typical_baseline_spend
+        disposable = typical_disposable_income
         ratio = compute_wealth_ratio(
             disposable_income=disposable,
             total_premium=0.0,
@@ -63,11 +63,11 @@ class TestExpectedLogWealthMath:
         
         assert ratio == 1.0  # No spending = ratio of 1
 
-    def test_higher_oop_means_lower_wealth(self, typical_couple_income, typical_baseline_spend):
+    def test_higher_oop_means_lower_wealth(self, typical_disposable_income):
         """Higher OOP should result in lower remaining wealth."""
         from src.insurance.geometric_mean import compute_wealth_ratio
         
-        disposable = typical_couple_income - typical_baseline_spend
+        disposable = typical_disposable_income
         
         ratio_low = compute_wealth_ratio(
             disposable_income=disposable,
@@ -154,6 +154,170 @@ class TestGeometricMeanWealth:
         assert abs(gm - expected_gm) < 0.01  # Allow small floating point error
 
 
+class TestGeometricMeanRatio:
+    """Test compute_geometric_mean_ratio on raw wealth ratios."""
+
+    def test_gm_long_list_no_underflow(self):
+        """Many small ratios should not underflow to 0 (sum of logs, not product)."""
+        from src.insurance.geometric_mean import compute_geometric_mean_ratio
+        
+        gm = compute_geometric_mean_ratio([1e-5] * 100)
+        
+        assert abs(gm - 1e-5) < 1e-15
+
+    def test_gm_exact_summation(self):
+        """exact=True (math.fsum) agrees for lists and arrays and keeps the zero rule."""
+        import numpy as np
+        from src.insurance.geometric_mean import compute_geometric_mean_ratio
+        
+        ratios = [0.9, 0.8, 0.7, 0.6] * 2_500
+        
+        gm = compute_geometric_mean_ratio(ratios, exact=True)
+        
+        assert gm == compute_geometric_mean_ratio(np.array(ratios), exact=True)
+        assert abs(gm - compute_geometric_mean_ratio([0.9, 0.8, 0.7, 0.6])) < 1e-14
+        assert compute_geometric_mean_ratio([0.9, 0.0], exact=True) == 0.0
+
+
+class TestWealthStats:
+    """Test the fused expected-log / GM computation."""
+
+    def test_stats_match_separate_functions(self, gold_ppo_plan, default_scenarios, typical_couple_income, typical_baseline_spend):
+        """compute_wealth_stats should return (E[log(W)], GM) from one pass."""
+        from src.insurance.geometric_mean import (
+            compute_expected_log_wealth,
+            compute_geometric_mean_wealth,
+            compute_wealth_stats,
+        )
+        
+        kwargs = dict(
+            after_tax_income=typical_couple_income,
+            baseline_spend=typical_baseline_spend,
+            plan=gold_ppo_plan,
+            scenarios=default_scenarios,
+        )
+        
+        expected_log, gm = compute_wealth_stats(**kwargs)
+        
+        assert expected_log == compute_expected_log_wealth(**kwargs)
+        assert gm == compute_geometric_mean_wealth(**kwargs)
+
+    def test_expected_log_matches_scalar_loop(self, gold_ppo_plan, default_scenarios, typical_couple_income, typical_baseline_spend):
+        """The vectorized E[log] should equal the per-scenario scalar formula."""
+        from src.insurance.geometric_mean import compute_wealth_ratio, compute_wealth_stats
+        
+        disposable = typical_couple_income - typical_baseline_spend
+        logs = [
+            math.log(compute_wealth_ratio(disposable, gold_ppo_plan.annual_premium, s.total_oop))
+            for s in default_scenarios
+        ]
+        
+        expected_log, _ = compute_wealth_stats(
+            after_tax_income=typical_couple_income,
+            baseline_spend=typical_baseline_spend,
+            plan=gold_ppo_plan,
+            scenarios=default_scenarios,
+        )
+        
+        assert expected_log == pytest.approx(sum(logs) / len(logs), abs=1e-12)
+
+    def test_stats_default_scenarios_use_plan(self, gold_ppo_plan, typical_couple_income, typical_baseline_spend):
+        """scenarios=None should match passing the plan's own scenarios."""
+        from src.insurance.geometric_mean import compute_wealth_stats
+        from src.insurance.scenarios import build_scenarios_for_plan
+        
+        kwargs = dict(
+            after_tax_income=typical_couple_income,
+            baseline_spend=typical_baseline_spend,
+            plan=gold_ppo_plan,
+        )
+        
+        assert compute_wealth_stats(scenarios=None, **kwargs) == compute_wealth_stats(
+            scenarios=build_scenarios_for_plan(gold_ppo_plan), **kwargs
+        )
+
+    def test_batch_matches_per_plan(self, gold_ppo_plan, platinum_ppo_plan, kaiser_gold_hmo, basic_dental, basic_vision):
+        """Batched E[log] should match compute_expected_log_wealth plan by plan."""
+        from src.insurance.geometric_mean import (
+            compute_expected_log_wealth,
+            compute_expected_log_wealth_batch,
+        )
+        
+        plans = [gold_ppo_plan, platinum_ppo_plan, kaiser_gold_hmo]
+        # $50k disposable: the PPOs survive, Kaiser's OON catastrophe ruins
+        kwargs = dict(
+            after_tax_income=130_000,
+            baseline_spend=80_000,
+            dental=basic_dental,
+            vision=basic_vision,
+        )
+        
+        batch = compute_expected_log_wealth_batch(plans=plans, scenarios=None, **kwargs)
+        
+        for plan, value in zip(plans, batch):
+            expected = compute_expected_log_wealth(plan=plan, scenarios=None, **kwargs)
+            assert value == pytest.approx(expected, abs=1e-12)
+        assert batch[2] == float("-inf")
+
+    def test_stats_accept_scenario_set(self, gold_ppo_plan, default_scenarios, typical_couple_income, typical_baseline_spend):
+        """A ScenarioSet should give the same result as the equivalent list."""
+        from src.insurance.geometric_mean import compute_wealth_stats
+        from src.insurance.scenarios import ScenarioSet
+        
+        kwargs = dict(
+            after_tax_income=typical_couple_income,
+            baseline_spend=typical_baseline_spend,
+            plan=gold_ppo_plan,
+        )
+        
+        assert compute_wealth_stats(
+            scenarios=ScenarioSet.from_scenarios(default_scenarios), **kwargs
+        ) == compute_wealth_stats(scenarios=default_scenarios, **kwargs)
+
+    def test_stats_accept_numpy_scalar_income(self, gold_ppo_plan, typical_couple_income, typical_baseline_spend):
+        """A 0-d array income gives the same stats as a float."""
+        import numpy as np
+        from src.insurance.geometric_mean import compute_wealth_stats
+        
+        kwargs = dict(baseline_spend=typical_baseline_spend, plan=gold_ppo_plan, scenarios=None)
+        
+        assert compute_wealth_stats(
+            after_tax_income=np.array(typical_couple_income), **kwargs
+        ) == compute_wealth_stats(after_tax_income=typical_couple_income, **kwargs)
+
+    def test_stats_no_disposable_income(self, gold_ppo_plan, default_scenarios):
+        """No disposable income → (-inf, 0)."""
+        from src.insurance.geometric_mean import compute_wealth_stats
+        
+        expected_log, gm = compute_wealth_stats(
+            after_tax_income=50_000,
+            baseline_spend=60_000,
+            plan=gold_ppo_plan,
+            scenarios=default_scenarios,
+        )
+        
+        assert expected_log == float("-inf")
+        assert gm == 0.0
+
+    def test_stats_ruin_short_circuits_without_warning(self, gold_ppo_plan, default_scenarios):
+        """A ruinous scenario → (-inf, 0) without taking log(0)."""
+        import warnings
+        from src.insurance.geometric_mean import compute_wealth_stats
+        
+        # $40k disposable can't cover Gold PPO premium + catastrophe OOP
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            expected_log, gm = compute_wealth_stats(
+                after_tax_income=100_000,
+                baseline_spend=60_000,
+                plan=gold_ppo_plan,
+                scenarios=default_scenarios,
+            )
+        
+        assert expected_log == float("-inf")
+        assert gm == 0.0
+
+
 class TestPlatinumVsGoldGM:
     """Test the key comparison: does Platinum improve GM over Gold?
     
@@ -166,8 +330,7 @@ class TestPlatinumVsGoldGM:
         self, 
         kaiser_gold_hmo, 
         kaiser_platinum_hmo, 
-        typical_couple_income, 
-        typical_baseline_spend
+        typical_disposable_income
     ):
         """Kaiser Platinum preserves more wealth in catastrophic scenarios.
         
@@ -177,7 +340,7 @@ class TestPlatinumVsGoldGM:
         """
         from src.insurance.geometric_mean import compute_wealth_ratio
         
-        disposable = typical_couple_income - typical_baseline_spend
+        disposable = typical_disposable_income
         
         # Catastrophic scenario - hit OOP max
         gold_ratio = compute_wealth_ratio(
@@ -200,8 +363,7 @@ class TestPlatinumVsGoldGM:
         self, 
         gold_ppo_plan, 
         platinum_ppo_plan, 
-        typical_couple_income, 
-        typical_baseline_spend
+        typical_disposable_income
     ):
         """PPO Platinum does NOT preserve more wealth - premium too high!
         
@@ -213,7 +375,7 @@ class TestPlatinumVsGoldGM:
         """
         from src.insurance.geometric_mean import compute_wealth_ratio
         
-        disposable = typical_couple_income - typical_baseline_spend
+        disposable = typical_disposable_income
         
         gold_ratio = compute_wealth_ratio(
             disposable_income=disposable,
@@ -235,13 +397,12 @@ class TestPlatinumVsGoldGM:
         self, 
         gold_ppo_plan, 
         platinum_ppo_plan, 
-        typical_couple_income, 
-        typical_baseline_spend
+        typical_disposable_income
     ):
         """Gold should preserve more wealth when no healthcare used."""
         from src.insurance.geometric_mean import compute_wealth_ratio
         
-        disposable = typical_couple_income - typical_baseline_spend
+        disposable = typical_disposable_income
         
         # No use scenario - only premium cost
         gold_ratio = compute_wealth_ratio(
@@ -0,0 +1,173 @@
+"""Tests for the numeric kernels behind compare_plans.
+
+The batch kernels run Numba-compiled code when Numba is installed and
+fall back to NumPy otherwise; both must agree with the scalar formulas.
+"""
+
+import numpy as np
+import pytest
+
+from src.insurance import _kernels
+from src.insurance.geometric_mean import compute_wealth_ratio
+
+
+PREMIUMS = np.array([20_000.0, 35_000.0])
+OOP = np.array([
+    [0.0, 400.0, 18_400.0, 34_900.0],
+    [0.0, 200.0, 10_000.0, 80_000.0],
+])
+
+
+class TestScenarioKernel:
+    """scenario_kernel fills wealth and floored ratios for every plan × scenario."""
+
+    def test_matches_scalar_wealth_ratio(self):
+        """Each cell should equal compute_wealth_ratio for that plan/scenario."""
+        wealth = np.empty_like(OOP)
+        ratios = np.empty_like(OOP)
+        
+        _kernels.scenario_kernel(100_000.0, PREMIUMS, 250.0, OOP, wealth, ratios)
+        
+        for i, premium in enumerate(PREMIUMS):
+            for j, oop in enumerate(OOP[i]):
+                assert wealth[i, j] == pytest.approx(100_000.0 - premium - oop - 250.0)
+                assert ratios[i, j] == pytest.approx(
+                    compute_wealth_ratio(100_000.0, premium, oop + 250.0)
+                )
+
+    def test_nonpositive_disposable_gives_zero_ratios(self):
+        """No disposable income → every ratio is 0."""
+        wealth = np.empty_like(OOP)
+        ratios = np.empty_like(OOP)
+        
+        _kernels.scenario_kernel(0.0, PREMIUMS, 0.0, OOP, wealth, ratios)
+        
+        assert (ratios == 0.0).all()
+        assert wealth[0, 0] == -20_000.0
+
+
+class TestLogWealthKernel:
+    """log_wealth_kernel computes mean log-ratio for one plan, -inf on ruin."""
+
+    def test_matches_scalar_formula(self):
+        """Should equal the mean of log(compute_wealth_ratio) over scenarios."""
+        import math
+        
+        expected = sum(
+            math.log(compute_wealth_ratio(100_000.0, 20_000.0, oop)) for oop in OOP[0]
+        ) / len(OOP[0])
+        
+        assert _kernels.log_wealth_kernel(100_000.0, 20_000.0, OOP[0]) == pytest.approx(expected, abs=1e-12)
+
+    @pytest.mark.parametrize("n", [3, 4, 5])
+    def test_unrolled_and_generic_paths_agree(self, n):
+        """The 4-scenario fast path and the generic loop give the same value."""
+        oop = np.linspace(0.0, 30_000.0, n)
+        ratios = (100_000.0 - 20_000.0 - oop) / 100_000.0
+        
+        assert _kernels.log_wealth_kernel(100_000.0, 20_000.0, oop) == pytest.approx(
+            np.log(ratios).mean(), abs=1e-12
+        )
+
+    @pytest.mark.parametrize("n", [3, 4])
+    def test_tiny_losses_keep_precision(self, n):
+        """Near-zero losses should not be rounded away before the log."""
+        import math
+        
+        oop = np.full(n, 1e-12)
+        
+        assert _kernels.log_wealth_kernel(3.0, 1e-12, oop) == pytest.approx(math.log1p(-2e-12 / 3.0), rel=1e-12)
+
+    def test_ruin_gives_negative_infinity(self):
+        """Any scenario that wipes out disposable income → -inf."""
+        assert _kernels.log_wealth_kernel(100_000.0, 35_000.0, OOP[1]) == float("-inf")
+
+
+class TestLogWealthBatch:
+    """log_wealth_batch applies log_wealth_kernel to every plan row."""
+
+    @pytest.mark.parametrize(
+        "batch",
+        [_kernels.log_wealth_batch, _kernels._log_wealth_batch_numpy],
+        ids=["active", "numpy"],
+    )
+    def test_rows_match_single_plan_kernel(self, batch):
+        """Each output should equal the single-plan kernel on that row."""
+        out = np.empty(len(PREMIUMS))
+        
+        batch(100_000.0, PREMIUMS, OOP, out)
+        
+        assert out[0] == pytest.approx(
+            _kernels.log_wealth_kernel(100_000.0, PREMIUMS[0], OOP[0]), abs=1e-12
+        )
+        assert out[1] == float("-inf")
+
+
+class TestWealthMatrix:
+    """wealth_matrix adds per-plan E[log] and GM on top of scenario_kernel."""
+
+    def test_reductions_match_ratios(self):
+        """E[log] is the mean log-ratio; a ruined plan gets -inf and GM = 0."""
+        wealth = np.empty_like(OOP)
+        ratios = np.empty_like(OOP)
+        expected_log = np.empty(len(PREMIUMS))
+        gm = np.empty(len(PREMIUMS))
+        
+        _kernels.wealth_matrix(100_000.0, PREMIUMS, 250.0, OOP, wealth, ratios, expected_log, gm)
+        
+        assert expected_log[0] == pytest.approx(np.log(ratios[0]).mean(), abs=1e-12)
+        assert gm[0] == pytest.approx(np.exp(expected_log[0]) * 100_000.0)
+        assert expected_log[1] == float("-inf")
+        assert gm[1] == 0.0
+
+    def test_expected_log_matches_log_wealth_kernel(self):
+        """compare_plans and the scalar path share one log kernel; gm_sweep agrees."""
+        wealth = np.empty_like(OOP)
+        ratios = np.empty_like(OOP)
+        expected_log = np.empty(len(PREMIUMS))
+        gm = np.empty(len(PREMIUMS))
+        sweep = np.empty((1, len(PREMIUMS)))
+        
+        _kernels.wealth_matrix(100_000.0, PREMIUMS, 250.0, OOP, wealth, ratios, expected_log, gm)
+        _kernels.gm_sweep(np.array([100_000.0]), PREMIUMS, OOP + 250.0, sweep)
+        
+        assert expected_log[0] == _kernels.log_wealth_kernel(100_000.0, PREMIUMS[0], OOP[0] + 250.0)
+        assert sweep[0] == pytest.approx(gm, rel=1e-12)
+
+    def test_no_disposable_income_is_ruin(self):
+        """disposable <= 0 → every plan gets -inf and GM = 0."""
+        wealth = np.empty_like(OOP)
+        ratios = np.empty_like(OOP)
+        expected_log = np.empty(len(PREMIUMS))
+        gm = np.empty(len(PREMIUMS))
+        
+        _kernels.wealth_matrix(0.0, PREMIUMS, 0.0, OOP, wealth, ratios, expected_log, gm)
+        
+        assert expected_log.tolist() == [float("-inf")] * len(PREMIUMS)
+        assert gm.tolist() == [0.0] * len(PREMIUMS)
+
+
+class TestLazyNumba:
+    """Numba is only imported by the batch kernels, never by the package."""
+
+    def test_package_import_does_not_import_numba(self):
+        """import src.insurance (and a comparison) stays Numba-free."""
+        import subprocess
+        import sys
+        from pathlib import Path
+        
+        code = (
+            "import sys; from src.insurance import compare_plans; "
+            "from src.insurance.data import ALL_PLANS; "
+            "compare_plans(ALL_PLANS, 180_000, 80_000); "
+            "print('numba' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parents[2],
+        )
+        
+        assert result.stdout.strip() == "False"
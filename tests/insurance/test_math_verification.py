@@ -101,8 +101,8 @@ class TestWealthRatioMath:
             scenario_oop=10_000,
         )
         expected = (117_350 - 20_924 - 10_000) / 117_350
-        assert abs(ratio - expected) < 1e-10
-        assert abs(ratio - 0.7366) < 0.001
+        assert ratio == pytest.approx(expected, abs=1e-10)
+        assert ratio == pytest.approx(0.7366, abs=0.001)
 
 
 class TestGeometricMeanMath:
@@ -122,7 +122,7 @@ class TestGeometricMeanMath:
         GM([2, 4, 8]) = (2 × 4 × 8)^(1/3) = 64^(1/3) = 4.0
         """
         gm = compute_geometric_mean_ratio([2.0, 4.0, 8.0])
-        assert abs(gm - 4.0) < 1e-10  # Floating point tolerance
+        assert gm == pytest.approx(4.0, abs=1e-10)  # Floating point tolerance
 
     def test_gm_wealth_ratios(self):
         """
@@ -133,8 +133,8 @@ class TestGeometricMeanMath:
         """
         gm = compute_geometric_mean_ratio([0.9, 0.8, 0.5])
         expected = (0.9 * 0.8 * 0.5) ** (1/3)
-        assert abs(gm - expected) < 1e-10
-        assert abs(gm - 0.7114) < 0.001
+        assert gm == pytest.approx(expected, abs=1e-10)
+        assert gm == pytest.approx(0.7114, abs=0.001)
 
     def test_gm_four_scenarios(self):
         """
@@ -146,7 +146,7 @@ class TestGeometricMeanMath:
         ratios = [0.82, 0.82, 0.73, 0.59]
         gm = compute_geometric_mean_ratio(ratios)
         expected = (0.82 * 0.82 * 0.73 * 0.59) ** 0.25
-        assert abs(gm - expected) < 1e-10
+        assert gm == pytest.approx(expected, abs=1e-10)
 
     def test_gm_with_zero_is_zero(self):
         """
@@ -162,7 +162,7 @@ class TestGeometricMeanMath:
         GM([0.7, 0.7, 0.7, 0.7]) = (0.7^4)^(1/4) = 0.7
         """
         gm = compute_geometric_mean_ratio([0.7, 0.7, 0.7, 0.7])
-        assert abs(gm - 0.7) < 1e-10
+        assert gm == pytest.approx(0.7, abs=1e-10)
 
     def test_gm_less_than_arithmetic_mean(self):
         """
@@ -179,8 +179,8 @@ class TestGeometricMeanMath:
         am = sum(ratios) / len(ratios)
         
         assert gm < am
-        assert abs(am - 0.75) < 1e-10
-        assert abs(gm - 0.7416) < 0.001
+        assert am == pytest.approx(0.75, abs=1e-10)
+        assert gm == pytest.approx(0.7416, abs=0.001)
 
 
 class TestDisposableIncomeMath:
@@ -214,8 +214,8 @@ class TestDisposableIncomeMath:
             baseline_spend=68_000,
         )
         expected = 275_000 * (1 - 0.326) - 68_000
-        assert abs(disposable - expected) < 1
-        assert abs(disposable - 117_350) < 1
+        assert disposable == pytest.approx(expected, abs=1)
+        assert disposable == pytest.approx(117_350, abs=1)
 
 
 class TestExpectedLogWealthMath:
@@ -238,7 +238,7 @@ class TestExpectedLogWealthMath:
         log_sum = sum(math.log(r) for r in ratios)
         expected = log_sum / len(ratios)
         
-        assert abs(expected - (-0.2990)) < 0.001
+        assert expected == pytest.approx(-0.2990, abs=0.001)
 
     def test_gm_from_exp_log(self):
         """
@@ -260,7 +260,7 @@ class TestExpectedLogWealthMath:
         expected_log = log_sum / len(ratios)
         gm_from_log = math.exp(expected_log)
         
-        assert abs(gm_direct - gm_from_log) < 1e-10
+        assert gm_direct == pytest.approx(gm_from_log, abs=1e-10)
 
 
 class TestEndToEndMath:
@@ -307,18 +307,18 @@ class TestEndToEndMath:
         ratios = [r1, r2, r3, r4]
         
         # Verify individual ratios
-        assert abs(r1 - 0.8217) < 0.001
-        assert abs(r2 - 0.8178) < 0.001
-        assert abs(r3 - 0.7366) < 0.001
-        assert abs(r4 - 0.5959) < 0.001
+        assert r1 == pytest.approx(0.8217, abs=0.001)
+        assert r2 == pytest.approx(0.8178, abs=0.001)
+        assert r3 == pytest.approx(0.7366, abs=0.001)
+        assert r4 == pytest.approx(0.5959, abs=0.001)
         
         # Verify GM
         gm = compute_geometric_mean_ratio(ratios)
         expected_gm = (r1 * r2 * r3 * r4) ** 0.25
-        assert abs(gm - expected_gm) < 1e-10
+        assert gm == pytest.approx(expected_gm, abs=1e-10)
         
         # The GM should be around 0.7336
-        assert abs(gm - 0.7336) < 0.01
+        assert gm == pytest.approx(0.7336, abs=0.01)
 
 
 class TestSpitznagelInsights:
@@ -339,9 +339,9 @@ class TestSpitznagelInsights:
         gm_good = compute_geometric_mean_ratio(ratios_good)
         gm_one_bad = compute_geometric_mean_ratio(ratios_one_bad)
         
-        assert abs(gm_good - 0.9) < 1e-10
+        assert gm_good == pytest.approx(0.9, abs=1e-10)
         expected_bad = (0.9 * 0.9 * 0.9 * 0.1) ** 0.25  # 0.5196...
-        assert abs(gm_one_bad - expected_bad) < 1e-10
+        assert gm_one_bad == pytest.approx(expected_bad, abs=1e-10)
         
         # One bad outcome cuts GM dramatically (>40% reduction)
         reduction = (gm_good - gm_one_bad) / gm_good
@@ -397,7 +397,7 @@ class TestSpitznagelInsights:
         net_benefit = oop_savings - premium_diff    # $7,032
         payoff_ratio = oop_savings / premium_diff   # 6.14x
         
-        assert abs(premium_diff - 1_368) < 1
-        assert abs(oop_savings - 8_400) < 1
-        assert abs(net_benefit - 7_032) < 1
+        assert premium_diff == pytest.approx(1_368, abs=1)
+        assert oop_savings == pytest.approx(8_400, abs=1)
+        assert net_benefit == pytest.approx(7_032, abs=1)
         assert payoff_ratio > 5.0  # Excellent payoff
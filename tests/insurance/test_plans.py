@@ -37,6 +37,15 @@ class TestMedicalPlanDataclass:
         assert hasattr(gold_ppo_plan, "expected_minor_oop")
         assert gold_ppo_plan.expected_minor_oop > 0
 
+    def test_medical_plan_positional_deductible(self):
+        """The fifth positional argument is the deductible."""
+        from src.insurance.plans import MedicalPlan, NetworkType
+        
+        plan = MedicalPlan("x", 1.0, 2.0, NetworkType.PPO, 500.0)
+        
+        assert plan.deductible == 500.0
+        assert plan.expected_minor_oop == 400.0
+
     def test_medical_plan_oon_emergency_flag(self, gold_ppo_plan):
         """MedicalPlan should track if OON emergency uses in-network rates."""
         assert hasattr(gold_ppo_plan, "oon_emergency_treated_as_in_network")
@@ -48,6 +57,15 @@ class TestMedicalPlanDataclass:
         assert hasattr(gold_ppo_plan, "post_stabilization_oon_covered")
         assert hasattr(gold_ppo_plan, "post_stabilization_exposure")
 
+    def test_medical_plan_is_frozen_and_hashable(self, gold_ppo_plan):
+        """Plans are immutable values: usable as dict / cache keys."""
+        from dataclasses import FrozenInstanceError
+        
+        with pytest.raises(FrozenInstanceError):
+            gold_ppo_plan.annual_premium = 0.0
+        assert {gold_ppo_plan: 1}[gold_ppo_plan] == 1
+        assert not hasattr(gold_ppo_plan, "__dict__")
+
 
 class TestMedicalPlanValues:
     """Test MedicalPlan with realistic values."""
@@ -149,6 +167,18 @@ class TestPlanTotalCost:
         
         assert total == gold_ppo_plan.annual_premium
 
+    def test_total_premiums_vec_matches_scalar(self, gold_ppo_plan, kaiser_gold_hmo, basic_dental, basic_vision):
+        """Vectorized totals should match total_annual_premium per plan."""
+        from src.insurance.plans import PlanTable, total_annual_premium, total_annual_premiums_vec
+        
+        plans = [gold_ppo_plan, kaiser_gold_hmo]
+        expected = [total_annual_premium(p, basic_dental, basic_vision) for p in plans]
+        
+        assert total_annual_premiums_vec(plans, basic_dental, basic_vision).tolist() == expected
+        table = PlanTable.from_plans(plans)
+        assert total_annual_premiums_vec(table, basic_dental, basic_vision).tolist() == expected
+        assert table.annual_premium.tolist() == [p.annual_premium for p in plans]
+
 
 class TestNetworkType:
     """Test NetworkType enum (from research findings)."""
@@ -225,3 +255,50 @@ class TestGroundAmbulanceExposure:
         assert hasattr(gold_ppo_plan, "ground_ambulance_exposure")
         # Research: $500-$2,000 exposure
         assert 500 <= gold_ppo_plan.ground_ambulance_exposure <= 2500
+
+
+class TestPlanTable:
+    """Test the struct-of-arrays plan table."""
+
+    def test_table_columns_match_plans(self, gold_ppo_plan, kaiser_gold_hmo):
+        """Each column should hold the plans' field values in order."""
+        from src.insurance.plans import PlanTable
+        
+        table = PlanTable.from_plans([gold_ppo_plan, kaiser_gold_hmo])
+        
+        assert len(table) == 2
+        assert table.names == (gold_ppo_plan.name, kaiser_gold_hmo.name)
+        assert table.annual_premium.tolist() == [
+            gold_ppo_plan.annual_premium,
+            kaiser_gold_hmo.annual_premium,
+        ]
+        assert table.in_network_oop_max.tolist() == [
+            gold_ppo_plan.in_network_oop_max,
+            kaiser_gold_hmo.in_network_oop_max,
+        ]
+
+    def test_table_columns_are_read_only(self, gold_ppo_plan):
+        """Shared tables must not be mutated in place."""
+        from src.insurance.plans import PlanTable
+        
+        table = PlanTable.from_plans([gold_ppo_plan])
+        
+        with pytest.raises(ValueError):
+            table.annual_premium[0] = 0.0
+
+    def test_constructor_copies_writable_columns(self, gold_ppo_plan):
+        """Mutating the caller's array must not reach a (cache-keyed) table."""
+        import numpy as np
+        from src.insurance.plans import PlanTable
+        
+        premium = np.array([gold_ppo_plan.annual_premium])
+        table = PlanTable(
+            plans=(gold_ppo_plan,),
+            names=(gold_ppo_plan.name,),
+            annual_premium=premium,
+            in_network_oop_max=np.array([gold_ppo_plan.in_network_oop_max]),
+        )
+        premium[0] = 0.0
+        
+        assert table.annual_premium.tolist() == [gold_ppo_plan.annual_premium]
+        assert not table.in_network_oop_max.flags.writeable
@@ -0,0 +1,74 @@
+"""Property-based tests for the geometric mean math.
+
+The hand-calculated cases in test_math_verification.py pin exact values;
+these check the defining properties over generated inputs. Skipped when
+hypothesis (dev extra) is not installed.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+from hypothesis import given, strategies as st
+
+from src.insurance.geometric_mean import (
+    compute_geometric_mean_ratio,
+    compute_geometric_mean_ratio_batch,
+)
+
+# Wealth ratios of a solvent scenario: (0, 1]
+ratio = st.floats(min_value=1e-6, max_value=1.0)
+ratio_lists = st.lists(ratio, min_size=1, max_size=12)
+
+
+class TestGeometricMeanProperties:
+    """Properties of compute_geometric_mean_ratio over generated ratios."""
+
+    @given(ratio_lists)
+    def test_gm_at_most_arithmetic_mean(self, ratios):
+        """AM-GM inequality: GM ≤ AM."""
+        gm = compute_geometric_mean_ratio(ratios)
+        am = sum(ratios) / len(ratios)
+        
+        assert gm <= am * (1 + 1e-12)
+
+    @given(ratio_lists)
+    def test_gm_between_min_and_max(self, ratios):
+        """GM lies between the smallest and largest ratio."""
+        gm = compute_geometric_mean_ratio(ratios)
+        
+        assert min(ratios) * (1 - 1e-12) <= gm <= max(ratios) * (1 + 1e-12)
+
+    @given(ratio_lists, st.data())
+    def test_any_zero_gives_zero(self, ratios, data):
+        """A single ruinous scenario anywhere makes GM = 0."""
+        i = data.draw(st.integers(min_value=0, max_value=len(ratios)))
+        ratios = ratios[:i] + [0.0] + ratios[i:]
+        
+        assert compute_geometric_mean_ratio(ratios) == 0.0
+        assert compute_geometric_mean_ratio(np.array(ratios)) == 0.0
+
+    @given(ratio_lists)
+    def test_list_array_and_exact_agree(self, ratios):
+        """List, array and exact=True paths agree to rounding."""
+        gm = compute_geometric_mean_ratio(ratios)
+        
+        assert math.isclose(gm, compute_geometric_mean_ratio(np.array(ratios)), rel_tol=1e-12)
+        assert math.isclose(gm, compute_geometric_mean_ratio(ratios, exact=True), rel_tol=1e-12)
+
+    @given(st.integers(min_value=1, max_value=6), st.integers(min_value=1, max_value=8), st.data())
+    def test_batch_matches_rows(self, n_rows, n_cols, data):
+        """Batch GM equals the scalar GM of each row."""
+        rows = data.draw(
+            st.lists(
+                st.lists(st.one_of(ratio, st.just(0.0)), min_size=n_cols, max_size=n_cols),
+                min_size=n_rows,
+                max_size=n_rows,
+            )
+        )
+        gms = compute_geometric_mean_ratio_batch(np.array(rows))
+        
+        for row, gm in zip(rows, gms):
+            assert math.isclose(gm, compute_geometric_mean_ratio(row), rel_tol=1e-12)
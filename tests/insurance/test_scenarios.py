@@ -123,6 +123,157 @@ class TestBuildScenariosForPlan:
         names = {s.name for s in scenarios}
         assert names == {"no_use", "minor_use", "cat_in_network", "cat_oon_emergency"}
 
+    def test_build_scenarios_is_cached(self, gold_ppo_plan):
+        """Repeated builds for the same plan should reuse the Scenario objects."""
+        from src.insurance.scenarios import build_scenarios_for_plan
+        
+        first = build_scenarios_for_plan(gold_ppo_plan)
+        second = build_scenarios_for_plan(gold_ppo_plan)
+        
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+
+    def test_cache_distinguishes_plan_fields(self, gold_ppo_plan, platinum_ppo_plan):
+        """Plans with different cost-sharing must not share cached scenarios."""
+        from src.insurance.scenarios import build_scenarios_for_plan
+        
+        gold = build_scenarios_for_plan(gold_ppo_plan)
+        platinum = build_scenarios_for_plan(platinum_ppo_plan)
+        
+        assert gold != platinum
+
+    def test_scenarios_are_immutable(self, gold_ppo_plan):
+        """Cached scenarios are shared, so they must be frozen."""
+        from dataclasses import FrozenInstanceError
+        from src.insurance.scenarios import build_scenarios_for_plan
+        
+        scenario = build_scenarios_for_plan(gold_ppo_plan)[0]
+        
+        with pytest.raises(FrozenInstanceError):
+            scenario.medical_oop = 1.0
+        assert not hasattr(scenario, "__dict__")
+
+    def test_plan_total_oop_matches_scenarios(self, gold_ppo_plan):
+        """plan_total_oop packs total_oop of the plan's scenarios, in order."""
+        from src.insurance.scenarios import build_scenarios_for_plan, plan_total_oop
+        
+        packed = plan_total_oop(gold_ppo_plan)
+        
+        assert packed.tolist() == [s.total_oop for s in build_scenarios_for_plan(gold_ppo_plan)]
+        assert packed is plan_total_oop(gold_ppo_plan)
+        assert not packed.flags.writeable
+
+
+class TestScenarioMatrix:
+    """build_scenario_matrix is the array form of build_scenarios_for_plan."""
+
+    def test_matches_per_plan_scenarios(self, gold_ppo_plan, kaiser_gold_hmo, anthem_gold_epo):
+        """Each row should equal that plan's scenario OOPs, in order."""
+        from src.insurance.scenarios import build_scenario_matrix, build_scenarios_for_plan
+        
+        plans = [gold_ppo_plan, kaiser_gold_hmo, anthem_gold_epo]
+        
+        medical_oop, extra_oon = build_scenario_matrix(plans)
+        
+        assert medical_oop.shape == extra_oon.shape == (3, 4)
+        for i, plan in enumerate(plans):
+            scenarios = build_scenarios_for_plan(plan)
+            assert medical_oop[i].tolist() == [s.medical_oop for s in scenarios]
+            assert extra_oon[i].tolist() == [s.extra_oon for s in scenarios]
+
+    def test_oon_emergency_not_in_network_doubles(self):
+        """The 2× OON emergency estimate should match the scalar builder."""
+        from src.insurance.plans import MedicalPlan
+        from src.insurance.scenarios import build_scenario_matrix, build_scenarios_for_plan
+        
+        plan = MedicalPlan(
+            name="Weird Plan",
+            annual_premium=20_000,
+            in_network_oop_max=10_000,
+            oon_emergency_treated_as_in_network=False,
+            post_stabilization_oon_covered=True,
+        )
+        
+        medical_oop, extra_oon = build_scenario_matrix([plan])
+        
+        cat_oon = build_scenarios_for_plan(plan)[3]
+        assert medical_oop[0, 3] == cat_oon.medical_oop == 20_000
+        assert extra_oon[0, 3] == cat_oon.extra_oon
+
+
+class TestScenarioTotalOopField:
+    """total_oop is stored at construction rather than recomputed per access."""
+
+    def test_replace_recomputes_total_oop(self, cat_oon_scenario):
+        """dataclasses.replace should derive total_oop from the new inputs."""
+        from dataclasses import replace
+        
+        updated = replace(cat_oon_scenario, extra_oon=0.0)
+        
+        assert updated.total_oop == cat_oon_scenario.medical_oop
+        assert updated != cat_oon_scenario
+
+
+class TestScenarioSet:
+    """Test the struct-of-arrays scenario container."""
+
+    def test_from_scenarios_round_trips(self, gold_ppo_plan):
+        """ScenarioSet should hold the same names and OOPs as the list."""
+        from src.insurance.scenarios import ScenarioSet, build_scenarios_for_plan
+        
+        scenarios = build_scenarios_for_plan(gold_ppo_plan)
+        scenario_set = ScenarioSet.from_scenarios(scenarios)
+        
+        assert len(scenario_set) == len(scenarios)
+        assert scenario_set.names == tuple(s.name for s in scenarios)
+        assert scenario_set.total_oop.tolist() == [s.total_oop for s in scenarios]
+
+    def test_for_plan_is_cached_and_read_only(self, gold_ppo_plan):
+        """The plan's standard ScenarioSet is shared, so it must be read-only."""
+        from src.insurance.scenarios import ScenarioSet
+        
+        scenario_set = ScenarioSet.for_plan(gold_ppo_plan)
+        
+        assert scenario_set is ScenarioSet.for_plan(gold_ppo_plan)
+        with pytest.raises(ValueError):
+            scenario_set.medical_oop[0] = 1.0
+
+    def test_constructor_copies_writable_arrays(self):
+        """Mutating the caller's array must not reach a (cache-keyed) set."""
+        import numpy as np
+        from src.insurance.scenarios import ScenarioSet
+        
+        medical_oop = np.array([0.0, 1000.0])
+        scenario_set = ScenarioSet(names=("a", "b"), medical_oop=medical_oop, extra_oon=np.zeros(2))
+        medical_oop[1] = 90_000.0
+        
+        assert scenario_set.medical_oop.tolist() == [0.0, 1000.0]
+        with pytest.raises(ValueError):
+            scenario_set.medical_oop[0] = 1.0
+
+
+class TestScenariosByName:
+    """Test name-keyed lookup of a plan's standard scenarios."""
+
+    def test_matches_scenario_list(self, gold_ppo_plan):
+        """The mapping should hold the builder's scenarios, in order."""
+        from src.insurance.scenarios import build_scenarios_for_plan, scenarios_by_name
+        
+        by_name = scenarios_by_name(gold_ppo_plan)
+        
+        assert list(by_name.values()) == build_scenarios_for_plan(gold_ppo_plan)
+        assert by_name["cat_oon_emergency"].medical_oop == gold_ppo_plan.in_network_oop_max
+
+    def test_is_cached_and_read_only(self, gold_ppo_plan):
+        """The mapping is shared between callers, so it must be read-only."""
+        from src.insurance.scenarios import scenarios_by_name
+        
+        by_name = scenarios_by_name(gold_ppo_plan)
+        
+        assert by_name is scenarios_by_name(gold_ppo_plan)
+        with pytest.raises(TypeError):
+            by_name["no_use"] = None
+
 
 class TestScenarioTotalCost:
     """Test scenario cost calculation."""
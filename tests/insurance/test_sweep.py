@@ -0,0 +1,78 @@
+"""Tests for income sweeps over plan comparisons.
+
+A sweep must agree with running compare_plans once per income.
+"""
+
+import numpy as np
+import pytest
+
+from src.insurance import _kernels
+
+
+class TestComparePlansSweep:
+    """compare_plans_sweep returns an incomes × plans GM matrix."""
+
+    def test_matches_compare_plans_per_income(
+        self, gold_ppo_plan, kaiser_gold_hmo, kaiser_platinum_hmo, basic_dental, basic_vision,
+        typical_baseline_spend,
+    ):
+        """Each row should equal compare_plans' GMs at that income (input plan order)."""
+        from src.insurance.compare import compare_plans
+        from src.insurance.sweep import compare_plans_sweep
+        
+        plans = [gold_ppo_plan, kaiser_gold_hmo, kaiser_platinum_hmo]
+        incomes = [200_000.0, 240_000.0, 300_000.0]
+        
+        gm = compare_plans_sweep(
+            plans=plans,
+            annual_incomes=incomes,
+            annual_baseline_spend=typical_baseline_spend,
+            dental=basic_dental,
+            vision=basic_vision,
+        )
+        
+        assert gm.shape == (3, 3)
+        for row, income in zip(gm, incomes):
+            results = compare_plans(
+                plans=plans,
+                annual_income=income,
+                annual_baseline_spend=typical_baseline_spend,
+                dental=basic_dental,
+                vision=basic_vision,
+            )
+            by_name = {r.plan_name: r.geometric_mean for r in results}
+            assert row.tolist() == pytest.approx([by_name[p.name] for p in plans])
+
+    def test_tax_rate_and_ruin(self, gold_ppo_plan, typical_baseline_spend, typical_tax_rate):
+        """Gross incomes are taxed; too little disposable income gives GM = 0."""
+        from src.insurance.compare import compare_plans
+        from src.insurance.sweep import compare_plans_sweep
+        
+        gm = compare_plans_sweep(
+            plans=[gold_ppo_plan],
+            annual_incomes=[150_000.0, 400_000.0],
+            annual_baseline_spend=typical_baseline_spend,
+            tax_rate=typical_tax_rate,
+        )
+        
+        expected = compare_plans(
+            plans=[gold_ppo_plan],
+            annual_income=400_000.0,
+            annual_baseline_spend=typical_baseline_spend,
+            tax_rate=typical_tax_rate,
+        )[0].geometric_mean
+        assert gm[0, 0] == 0.0
+        assert gm[1, 0] == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "kernel",
+        [_kernels.gm_sweep, _kernels._gm_sweep_numpy],
+        ids=["active", "numpy"],
+    )
+    def test_kernel_zero_for_nonpositive_disposable(self, kernel):
+        """No disposable income → GM = 0 for every plan."""
+        out = np.empty((2, 1))
+        
+        kernel(np.array([0.0, -5_000.0]), np.array([10_000.0]), np.zeros((1, 4)), out)
+        
+        assert (out == 0.0).all()
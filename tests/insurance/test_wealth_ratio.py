@@ -127,6 +127,21 @@ class TestAfterTaxIncome:
         
         assert disposable == 100_000
 
+    def test_specialized_helpers_match(self):
+        """disposable_from_after_tax / disposable_from_gross match the general form."""
+        from src.insurance.geometric_mean import (
+            compute_disposable_income,
+            disposable_from_after_tax,
+            disposable_from_gross,
+        )
+        
+        assert disposable_from_after_tax(180_000.0, 80_000.0) == compute_disposable_income(
+            after_tax_income=180_000.0, baseline_spend=80_000.0
+        )
+        assert disposable_from_gross(240_000.0, 0.25, 80_000.0) == compute_disposable_income(
+            gross_income=240_000.0, tax_rate=0.25, baseline_spend=80_000.0
+        )
+
     def test_after_tax_takes_precedence(self):
         """If both after_tax and gross provided, after_tax should win."""
         from src.insurance.geometric_mean import compute_disposable_income
@@ -184,6 +199,40 @@ class TestGeometricMeanRatio:
         
         assert gm < am
 
+    def test_gm_four_ratios_unrolled(self):
+        """The four-scenario path should match exact summation for lists and arrays."""
+        import numpy as np
+        from src.insurance.geometric_mean import compute_geometric_mean_ratio
+        
+        ratios = [0.9, 0.8, 0.7, 0.6]
+        expected = compute_geometric_mean_ratio(ratios, exact=True)
+        
+        assert abs(compute_geometric_mean_ratio(ratios) - expected) < 1e-15
+        assert compute_geometric_mean_ratio(np.array(ratios)) == compute_geometric_mean_ratio(ratios)
+        assert compute_geometric_mean_ratio(np.array([0.9, 0.8, 0.0, 0.6])) == 0.0
+        # Log space: tiny ratios don't underflow
+        assert abs(compute_geometric_mean_ratio([1e-100] * 4) / 1e-100 - 1) < 1e-12
+
+    def test_gm_batch_matches_rows(self):
+        """Batch GM should score each row like the scalar function, zeros included."""
+        import numpy as np
+        from src.insurance.geometric_mean import (
+            compute_geometric_mean_ratio,
+            compute_geometric_mean_ratio_batch,
+        )
+        
+        ratios = np.array([
+            [0.9, 0.8, 0.7, 0.6],
+            [1.0, 1.0, 1.0, 1.0],
+            [1.0, 0.9, 0.8, 0.0],
+        ])
+        gms = compute_geometric_mean_ratio_batch(ratios)
+        
+        assert gms.shape == (3,)
+        for row, gm in zip(ratios, gms):
+            assert abs(gm - compute_geometric_mean_ratio(row.tolist())) < 1e-12
+        assert gms[2] == 0.0
+
 
 class TestExpectedLogWealthRefactored:
     """Test the refactored expected log-wealth calculation."""
@@ -306,3 +355,62 @@ class TestScenarioOutcomesAsRatios:
         
         # OON catastrophe (last scenario) should be lowest
         assert outcomes[-1] == min(outcomes)
+
+    def test_outcomes_match_scalar_wealth_ratio(self, gold_ppo_plan, default_scenarios):
+        """Vectorized outcomes should equal compute_wealth_ratio per scenario."""
+        import numpy as np
+        from src.insurance.geometric_mean import build_scenario_outcomes, compute_wealth_ratio
+        
+        outcomes = build_scenario_outcomes(
+            disposable_income=100_000,
+            plan=gold_ppo_plan,
+            scenarios=default_scenarios,
+        )
+        
+        assert isinstance(outcomes, np.ndarray)
+        expected = [
+            compute_wealth_ratio(
+                disposable_income=100_000,
+                total_premium=gold_ppo_plan.annual_premium,
+                scenario_oop=s.total_oop,
+            )
+            for s in default_scenarios
+        ]
+        assert outcomes.tolist() == expected
+
+    def test_gm_of_array_matches_list(self):
+        """compute_geometric_mean_ratio should accept NumPy arrays."""
+        import numpy as np
+        from src.insurance.geometric_mean import compute_geometric_mean_ratio
+        
+        ratios = [0.9, 0.8, 0.7, 0.6]
+        
+        assert abs(
+            compute_geometric_mean_ratio(np.array(ratios)) - compute_geometric_mean_ratio(ratios)
+        ) < 1e-12
+        assert compute_geometric_mean_ratio(np.array([0.9, 0.0, 0.8])) == 0.0
+
+    def test_batch_outcomes_match_per_plan(
+        self, gold_ppo_plan, kaiser_gold_hmo, default_scenarios, basic_dental, basic_vision
+    ):
+        """Each batch row should equal build_scenario_outcomes for that plan."""
+        import numpy as np
+        from src.insurance.geometric_mean import (
+            build_scenario_outcomes,
+            build_scenario_outcomes_batch,
+        )
+        
+        plans = [gold_ppo_plan, kaiser_gold_hmo]
+        for scenarios in (None, default_scenarios):
+            ratios = build_scenario_outcomes_batch(
+                80_000, plans, scenarios, dental=basic_dental, vision=basic_vision
+            )
+            
+            assert ratios.shape == (2, 4)
+            for plan, row in zip(plans, ratios):
+                expected = build_scenario_outcomes(
+                    80_000, plan, scenarios, dental=basic_dental, vision=basic_vision
+                )
+                np.testing.assert_allclose(row, expected, rtol=0, atol=1e-15)
+        
+        assert not build_scenario_outcomes_batch(0.0, plans, None).any()